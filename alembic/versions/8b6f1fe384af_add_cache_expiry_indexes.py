@@ -0,0 +1,42 @@
+"""add_cache_expiry_indexes
+
+Revision ID: 8b6f1fe384af
+Revises: 99b1c4f5b85e
+Create Date: 2026-10-15 21:52:10.412377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b6f1fe384af'
+down_revision: Union[str, None] = '99b1c4f5b85e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # clear_old_book_caches deletes by updated_at on every search. Without an index
+    # that's a full scan of the cached books table
+    op.create_index(
+        'ix_audiobook_updated_at',
+        'audiobook',
+        ['updated_at']
+    )
+
+    # Expired persisted searches are deleted by provider and age. provider is only
+    # the second column of the primary key, so it can't be used for that
+    op.create_index(
+        'ix_metadatacache_provider_created_at',
+        'metadatacache',
+        ['provider', 'created_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_metadatacache_provider_created_at', table_name='metadatacache')
+    op.drop_index('ix_audiobook_updated_at', table_name='audiobook')
@@ -1,21 +1,36 @@
 import asyncio
+import json
 import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Literal, TypedDict, cast
-from urllib.parse import urlencode
+from functools import lru_cache
+from typing import Literal, TypedDict, cast, override
 
 from aiohttp import ClientError, ClientSession
-from pydantic import BaseModel, ValidationError
-from sqlalchemy import CursorResult, delete
-from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import CursorResult, delete, exists
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlmodel import Session, col, not_, select
+from yarl import URL
 
 from app.internal.env_settings import Settings
-from app.internal.models import Audiobook, AudiobookRequest
-from app.util.exceptions import handle_external_api_error
+from app.internal.models import Audiobook, AudiobookRequest, MetadataCache
+from app.util.cache import TTLCache
+from app.util.connection import get_shared_client_session
+from app.util.db import get_session
+from app.util.exceptions import (
+    handle_cache_error,
+    handle_database_error,
+    handle_external_api_error,
+)
 from app.util.log import logger
 
 REFETCH_TTL = 60 * 60 * 24 * 7  # 1 week
+STALE_TTL = REFETCH_TTL * 2
+"""Cached searches older than REFETCH_TTL are still served up to this age while being refetched in the background"""
 
 audible_region_type = Literal[
     "us",
@@ -44,16 +59,41 @@ audible_regions: dict[audible_region_type, str] = {
     "br": ".com.br",
 }
 
+# built once, as every search and book lookup needs one of these
+_audible_api_urls: dict[audible_region_type, URL] = {
+    region: URL(f"https://api.audible{tld}/1.0")
+    for region, tld in audible_regions.items()
+}
+_audible_products_urls: dict[audible_region_type, URL] = {
+    region: url / "catalog" / "products" for region, url in _audible_api_urls.items()
+}
+_AUDNEXUS_BOOKS_URL = URL("https://api.audnex.us/books")
+_AUDIMETA_BOOK_URL = URL("https://audimeta.de/book")
+
 
 def clear_old_book_caches(session: Session):
     """Deletes outdated cached audiobooks that haven't been requested by anyone"""
+    # compared against the indexed timestamps as is, so both deletes are index range scans
+    cutoff = datetime.fromtimestamp(time.time() - REFETCH_TTL)
+    # NOT EXISTS probes the (asin, user_username) primary key of the requests per book,
+    # and lets PostgreSQL plan an anti-join instead of materializing all requested ASINs
     delete_query = delete(Audiobook).where(
-        col(Audiobook.updated_at) < datetime.fromtimestamp(time.time() - REFETCH_TTL),
-        col(Audiobook.asin).not_in(select(col(AudiobookRequest.asin).distinct())),
+        col(Audiobook.updated_at) < cutoff,
+        ~exists().where(col(AudiobookRequest.asin) == col(Audiobook.asin)),
         not_(Audiobook.downloaded),
     )
     result = cast(CursorResult[Audiobook], session.execute(delete_query))
+    session.execute(
+        delete(MetadataCache).where(
+            col(MetadataCache.provider) == _PERSISTED_SEARCH_PROVIDER,
+            col(MetadataCache.created_at) < cutoff,
+        )
+    )
     session.commit()
+    search_cache.expire()
+    search_suggestions_cache.expire()
+    _prefetched_asins.expire()
+    _missing_asins.expire()
     logger.debug("Cleared old book caches", rowcount=result.rowcount)
 
 
@@ -78,6 +118,10 @@ class _AudnexusResponse(BaseModel):
     runtimeLengthMin: int = 0
 
 
+class _ProviderUnavailable(Exception):
+    """A book provider failed to answer, as opposed to not knowing the book"""
+
+
 async def _get_audnexus_book(
     session: ClientSession,
     asin: str,
@@ -85,11 +129,14 @@ async def _get_audnexus_book(
 ) -> Audiobook | None:
     """
     https://audnex.us/#tag/Books/operation/getBookById
+
+    Returns None if Audnexus doesn't know the book and raises
+    `_ProviderUnavailable` on any other failure.
     """
     logger.debug("Fetching book from Audnexus", asin=asin, region=region)
     try:
         async with session.get(
-            f"https://api.audnex.us/books/{asin}?region={region}",
+            (_AUDNEXUS_BOOKS_URL / asin).with_query(region=region),
             headers={"Client-Agent": "audiobookrequest"},
         ) as response:
             if not response.ok:
@@ -99,11 +146,17 @@ async def _get_audnexus_book(
                     status=response.status,
                     reason=response.reason,
                 )
-                return None
-            audnexus_response = _AudnexusResponse.model_validate(await response.json())
+                if response.status == 404:
+                    return None
+                raise _ProviderUnavailable()
+            audnexus_response = _AudnexusResponse.model_validate_json(
+                await response.read()
+            )
     except (ClientError, ValidationError, ValueError) as e:
         handle_external_api_error(e, "Audnexus", "fetch book", asin=asin)
-        return None
+        raise _ProviderUnavailable() from e
+    # not model_construct: it skips the ORM instrumentation, so the book couldn't be
+    # added to a session afterwards. Table models don't validate in __init__ anyway.
     return Audiobook(
         asin=audnexus_response.asin,
         title=audnexus_response.title,
@@ -137,11 +190,14 @@ async def _get_audimeta_book(
 ) -> Audiobook | None:
     """
     https://audimeta.de/api-docs/#/book/get_book__asin_
+
+    Returns None if Audimeta doesn't know the book and raises
+    `_ProviderUnavailable` on any other failure.
     """
     logger.debug("Fetching book from Audimeta", asin=asin, region=region)
     try:
         async with session.get(
-            f"https://audimeta.de/book/{asin}?region={region}",
+            (_AUDIMETA_BOOK_URL / asin).with_query(region=region),
             headers={"Client-Agent": "audiobookrequest"},
         ) as response:
             if not response.ok:
@@ -151,11 +207,15 @@ async def _get_audimeta_book(
                     status=response.status,
                     reason=response.reason,
                 )
-                return None
-            audimeta_response = _AudimetaResponse.model_validate(await response.json())
+                if response.status == 404:
+                    return None
+                raise _ProviderUnavailable()
+            audimeta_response = _AudimetaResponse.model_validate_json(
+                await response.read()
+            )
     except (ClientError, ValidationError, ValueError) as e:
         handle_external_api_error(e, "Audimeta", "fetch book", asin=asin)
-        return None
+        raise _ProviderUnavailable() from e
     return Audiobook(
         asin=audimeta_response.asin,
         title=audimeta_response.title,
@@ -168,46 +228,179 @@ async def _get_audimeta_book(
     )
 
 
+# ASINs both providers answered with a 404. Kept briefly, as new books can show up soon after
+_missing_asins: TTLCache[tuple[str, audible_region_type], None] = TTLCache(
+    maxsize=4096, ttl=5 * 60
+)
+
+
 async def get_book_by_asin(
     session: ClientSession,
     asin: str,
     audible_region: audible_region_type | None = None,
 ) -> Audiobook | None:
+    """
+    Queries Audimeta and Audnexus concurrently and returns the first book found.
+    The slower request is cancelled once one of them returns the book.
+    """
     if audible_region is None:
         audible_region = get_region_from_settings()
-    book = await _get_audimeta_book(session, asin, audible_region)
-    if book:
-        return book
-    logger.debug(
-        "Audimeta did not have the book, trying Audnexus",
-        asin=asin,
-        region=audible_region,
-    )
-    book = await _get_audnexus_book(session, asin, audible_region)
-    if book:
-        return book
+    if (asin, audible_region) in _missing_asins:
+        return None
+    tasks = [
+        asyncio.create_task(_get_audimeta_book(session, asin, audible_region)),
+        asyncio.create_task(_get_audnexus_book(session, asin, audible_region)),
+    ]
+    unavailable = False
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                book = await next_done
+            except _ProviderUnavailable:
+                unavailable = True
+                continue
+            if book:
+                return book
+    finally:
+        for task in tasks:
+            if task.done() and not task.cancelled():
+                # the slower provider may have failed already, that no longer matters
+                _ = task.exception()
+            task.cancel()
     logger.warning(
         "Did not find the book on both Audnexus and Audimeta",
         asin=asin,
         region=audible_region,
     )
+    # an outage of either provider shouldn't hide the book until the cache expires
+    if not unavailable:
+        _missing_asins[(asin, audible_region)] = None
+
+
+async def _fetch_books(
+    client_session: ClientSession,
+    asins: set[str],
+    audible_region: audible_region_type,
+) -> list[Audiobook]:
+    """
+    Fetches the details of all given ASINs concurrently, limited to
+    `max_concurrent_audible_requests` requests at a time. Failed lookups are skipped.
+    """
+    if not asins:
+        # common when every result was already cached, skips reading the settings
+        return []
+    semaphore = asyncio.Semaphore(Settings().app.max_concurrent_audible_requests)
+
+    async def fetch(asin: str) -> Audiobook | None:
+        async with semaphore:
+            return await get_book_by_asin(client_session, asin, audible_region)
+
+    results = await asyncio.gather(
+        *(fetch(asin) for asin in asins), return_exceptions=True
+    )
+    books: list[Audiobook] = []
+    for asin, result in zip(asins, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                "Unexpected error while fetching book",
+                asin=asin,
+                region=audible_region,
+                error=result,
+            )
+        elif result:
+            books.append(result)
+    return books
 
 
-class CacheQuery(BaseModel, frozen=True):
+@dataclass(frozen=True, slots=True)
+class CacheQuery:
     query: str
     num_results: int
     page: int
     audible_region: audible_region_type
+    # keys are interned by _cache_key and then hashed by every cache lookup
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((self.query, self.num_results, self.page, self.audible_region)),
+        )
+
+    @override
+    def __hash__(self) -> int:
+        return self._hash
+
+
+@lru_cache(maxsize=4096)
+def _cache_key(
+    query: str, num_results: int, page: int, audible_region: audible_region_type
+) -> CacheQuery:
+    """
+    Interns cache keys so repeated searches reuse the same CacheQuery object.
+    The query is lowercased and its whitespace collapsed, as Audible's search doesn't
+    care either, so "Brandon  Sanderson " and "brandon sanderson" share one entry.
+    """
+    return CacheQuery(
+        query=" ".join(query.lower().split()),
+        num_results=num_results,
+        page=page,
+        audible_region=audible_region,
+    )
 
 
-class CacheResult[T](BaseModel, frozen=True):
+@dataclass(frozen=True, slots=True)
+class CacheResult[T]:
+    # cached values are tuples, so callers get their own list and can't change a
+    # result that is shared with every other request hitting the cache
     value: T
     timestamp: float
 
 
 # simple caching of search results to avoid having to fetch from audible so frequently
-search_cache: dict[CacheQuery, CacheResult[list[Audiobook]]] = {}
-search_suggestions_cache: dict[str, CacheResult[list[str]]] = {}
+# Only the ordered ASINs are kept. The books are loaded from the db on every hit (see
+# _load_cached_books), so writes to them show up immediately, storing books never has to
+# evict entries here and no ORM instances are shared between sessions.
+search_cache: TTLCache[CacheQuery, CacheResult[tuple[str, ...]]] = TTLCache(
+    maxsize=1024, ttl=STALE_TTL
+)
+# suggestions differ per region, so they are keyed by (query, region)
+search_suggestions_cache: TTLCache[
+    tuple[str, audible_region_type], CacheResult[tuple[str, ...]]
+] = TTLCache(maxsize=4096, ttl=REFETCH_TTL)
+
+# fetches currently in progress, so identical concurrent requests only hit audible once.
+# Searches resolve to the ordered ASINs, as the books belong to the fetching db session.
+_inflight_searches: dict[CacheQuery, asyncio.Future[list[str] | None]] = {}
+_inflight_suggestions: dict[
+    tuple[str, audible_region_type], asyncio.Future[tuple[str, ...] | None]
+] = {}
+# background refetches of stale search results. Holds a reference so they aren't garbage collected
+_revalidation_tasks: dict[CacheQuery, asyncio.Task[None]] = {}
+
+
+def _load_cached_books(
+    session: Session, asins: Sequence[str]
+) -> list[Audiobook] | None:
+    """
+    Loads the books of a cached search result in a single query, in the cached order.
+    Returns None if any of them no longer exists in the database.
+    """
+    if not asins:
+        return []
+    books = {
+        book.asin: book
+        for book in session.exec(
+            select(Audiobook)
+            .where(col(Audiobook.asin).in_(asins))
+            # books already in the session are reloaded, like session.refresh would
+            .execution_options(populate_existing=True)
+        ).all()
+    }
+    if any(asin not in books for asin in asins):
+        return None
+    return [books[asin] for asin in asins]
 
 
 class _AudibleSuggestionsResponse(BaseModel):
@@ -218,13 +411,13 @@ class _AudibleSuggestionsResponse(BaseModel):
                     class _Title(BaseModel):
                         value: str
 
-                    title: _Title
+                    title: _Title | None = None
 
                 class _TitleGroup(BaseModel):
                     class _Title(BaseModel):
                         value: str
 
-                    title: _Title
+                    title: _Title | None = None
 
                 product_metadata: _Metadata | None = None
                 title_group: _TitleGroup | None = None
@@ -251,26 +444,49 @@ async def get_search_suggestions(
 ) -> list[str]:
     if audible_region is None:
         audible_region = get_region_from_settings()
-    cache_result = search_suggestions_cache.get(query)
+    key = (query, audible_region)
+    cache_result = search_suggestions_cache.get(key)
     if cache_result and time.time() - cache_result.timestamp < REFETCH_TTL:
-        return cache_result.value
+        return list(cache_result.value)
 
-    params = {
-        "key_strokes": query,
-        "site_variant": "desktop",
-    }
-    base_url = (
-        f"https://api.audible{audible_regions[audible_region]}/1.0/searchsuggestions?"
+    inflight = _inflight_suggestions.get(key)
+    if inflight is not None:
+        shared_titles = await asyncio.shield(inflight)
+        if shared_titles is not None:
+            return list(shared_titles)
+
+    future: asyncio.Future[tuple[str, ...] | None] = (
+        asyncio.get_running_loop().create_future()
+    )
+    _inflight_suggestions[key] = future
+    try:
+        titles = await _fetch_search_suggestions(client_session, query, audible_region)
+        # waiters get a copy each, like cache hits, so nobody shares this list
+        future.set_result(tuple(titles))
+        return titles
+    finally:
+        if _inflight_suggestions.get(key) is future:
+            del _inflight_suggestions[key]
+        if not future.done():
+            future.set_result(None)
+
+
+async def _fetch_search_suggestions(
+    client_session: ClientSession,
+    query: str,
+    audible_region: audible_region_type,
+) -> list[str]:
+    url = (_audible_api_urls[audible_region] / "searchsuggestions").with_query(
+        key_strokes=query, site_variant="desktop"
     )
-    url = base_url + urlencode(params)
 
     try:
         async with client_session.get(url) as response:
             response.raise_for_status()
-            suggestions = _AudibleSuggestionsResponse.model_validate(
-                await response.json()
+            suggestions = _AudibleSuggestionsResponse.model_validate_json(
+                await response.read()
             )
-    except Exception as e:
+    except (ClientError, TimeoutError, ValidationError, ValueError) as e:
         logger.error(
             "Exception while fetching search suggestions from Audible",
             query=query,
@@ -280,8 +496,8 @@ async def get_search_suggestions(
         return []
 
     titles = [item.model.title for item in suggestions.model.items if item.model.title]
-    search_suggestions_cache[query] = CacheResult(
-        value=titles,
+    search_suggestions_cache[(query, audible_region)] = CacheResult(
+        value=tuple(titles),
         timestamp=time.time(),
     )
 
@@ -295,6 +511,186 @@ class _AudibleSearchResponse(BaseModel):
     products: list[_AsinObj]
 
 
+_PERSISTED_SEARCH_PROVIDER = "audible_search"
+_PersistedAsins = TypeAdapter(list[str])
+
+
+def _persisted_search_key(cache_key: CacheQuery) -> str:
+    # the query goes last, so any colons in it can't be confused with the other fields
+    return f"{cache_key.audible_region}:{cache_key.num_results}:{cache_key.page}:{cache_key.query}"
+
+
+def _load_persisted_asins(
+    session: Session, cache_key: CacheQuery
+) -> tuple[list[str], float] | None:
+    """
+    Only the ASINs are persisted, the books themselves are then loaded from the
+    audiobook table by the ORM, which doesn't run any pydantic validation.
+    Returns the ASINs together with the time they were fetched.
+    """
+    entry = session.get(
+        MetadataCache, (_persisted_search_key(cache_key), _PERSISTED_SEARCH_PROVIDER)
+    )
+    if not entry or entry.created_at < datetime.fromtimestamp(
+        time.time() - REFETCH_TTL
+    ):
+        return None
+    try:
+        asins = _PersistedAsins.validate_json(entry.metadata_json)
+    except ValidationError as e:
+        handle_cache_error(e, "load persisted search", entry.search_key)
+        return None
+    return asins, entry.created_at.timestamp()
+
+
+def _persist_asins(session: Session, pages: dict[CacheQuery, list[str]]):
+    """Stores the ASINs of all fetched pages with a single commit"""
+    created_at = datetime.now()
+    try:
+        for cache_key, asins in pages.items():
+            session.merge(
+                MetadataCache(
+                    search_key=_persisted_search_key(cache_key),
+                    provider=_PERSISTED_SEARCH_PROVIDER,
+                    metadata_json=json.dumps(asins),
+                    created_at=created_at,
+                )
+            )
+        session.commit()
+    except SQLAlchemyError as e:
+        query = next(iter(pages)).query
+        handle_database_error(
+            e, "persist search", rollback_session=session, query=query
+        )
+
+
+_MAX_AUDIBLE_NUM_RESULTS = 50
+
+# the neighbouring page that was fetched along with a requested page, until it's requested.
+# Kept with the time it was fetched
+_prefetched_asins: TTLCache[CacheQuery, tuple[list[str], float]] = TTLCache(
+    maxsize=1024, ttl=REFETCH_TTL
+)
+
+
+async def _get_product_asins(
+    session: Session,
+    client_session: ClientSession,
+    base_url: URL,
+    params: dict[str, str | int],
+    cache_key: CacheQuery,
+) -> tuple[list[str], float]:
+    """
+    Returns the ordered product ASINs of an Audible catalog query and the time they
+    were fetched from Audible. The ASINs are also persisted in the database, so that
+    after a restart, when the in-memory cache is empty, queries seen in the last
+    REFETCH_TTL don't have to hit Audible again.
+
+    Pages are fetched in pairs, so paginating forward doesn't cost another request.
+    """
+    prefetched = _prefetched_asins.pop(cache_key, None)
+    if prefetched is not None:
+        logger.debug("Using prefetched search page", query=cache_key.query)
+        return prefetched
+    persist = Settings().app.persist_search_cache
+    if persist and cache_key not in search_cache:
+        persisted = _load_persisted_asins(session, cache_key)
+        if persisted is not None:
+            logger.debug("Using persisted search result", query=cache_key.query)
+            return persisted
+    fetched_at = time.time()
+    pages = await _fetch_page_pair(client_session, base_url, params, cache_key)
+    for page_key, page_asins in pages.items():
+        if page_key != cache_key:
+            _prefetched_asins[page_key] = (page_asins, fetched_at)
+    if persist:
+        _persist_asins(session, pages)
+    return pages[cache_key], fetched_at
+
+
+async def _fetch_page_pair(
+    client_session: ClientSession,
+    base_url: URL,
+    params: dict[str, str | int],
+    cache_key: CacheQuery,
+) -> dict[CacheQuery, list[str]]:
+    """
+    Fetches the requested page together with its neighbour (pages 0+1, 2+3, ...) by
+    requesting twice the page size, and splits the result back into the two pages.
+    Falls back to only the requested page if the doubled size exceeds Audible's limit.
+    """
+    num_results = cache_key.num_results
+    if num_results * 2 > _MAX_AUDIBLE_NUM_RESULTS:
+        url = base_url.with_query(params)
+        return {cache_key: await _fetch_product_asins(client_session, url, cache_key)}
+
+    batch_key = _cache_key(
+        cache_key.query, num_results * 2, cache_key.page // 2, cache_key.audible_region
+    )
+    url = base_url.with_query(
+        {**params, "num_results": batch_key.num_results, "page": batch_key.page}
+    )
+    asins = await _fetch_product_asins(client_session, url, batch_key)
+    first_page = batch_key.page * 2
+    return {
+        _cache_key(
+            cache_key.query, num_results, first_page + i, cache_key.audible_region
+        ): asins[i * num_results : (i + 1) * num_results]
+        for i in range(2)
+    }
+
+
+# ETag and ASINs of the last catalog response per query. Kept longer than the search
+# cache so that a refetch after REFETCH_TTL can be made conditional.
+_search_etags: TTLCache[CacheQuery, tuple[str, list[str]]] = TTLCache(
+    maxsize=1024, ttl=REFETCH_TTL * 4
+)
+
+
+async def _fetch_product_asins(
+    client_session: ClientSession,
+    url: URL,
+    cache_key: CacheQuery,
+) -> list[str]:
+    """
+    Fetches the ordered product ASINs of an Audible catalog query. If Audible sent
+    an ETag for the same query before, the request is conditional and a
+    `304 Not Modified` reuses the previous ASINs without downloading the body again.
+    """
+    validator = _search_etags.get(cache_key)
+    headers = {"If-None-Match": validator[0]} if validator else None
+    async with client_session.get(url, headers=headers) as response:
+        if response.status == 304 and validator:
+            logger.debug("Audible search not modified", query=cache_key.query)
+            return validator[1]
+        response.raise_for_status()
+        audible_response = _AudibleSearchResponse.model_validate_json(
+            await response.read()
+        )
+        # the same ASIN can be listed more than once, e.g. for reissues. Keep the first
+        asins = list(
+            dict.fromkeys(product.asin for product in audible_response.products)
+        )
+        if etag := response.headers.get("ETag"):
+            _search_etags[cache_key] = (etag, asins)
+        return asins
+
+
+def _lookup_failed(
+    product_asins: list[str],
+    books: dict[str, Audiobook],
+    audible_region: audible_region_type,
+) -> bool:
+    """
+    Whether a book is missing from the results because its lookup failed, rather than
+    because neither provider knows it. Such results shouldn't be cached for a week.
+    """
+    return any(
+        asin not in books and (asin, audible_region) not in _missing_asins
+        for asin in product_asins
+    )
+
+
 async def list_popular_books(
     session: Session,
     client_session: ClientSession,
@@ -308,41 +704,38 @@ async def list_popular_books(
     if audible_region is None:
         audible_region = get_region_from_settings()
 
-    cache_key = CacheQuery(
-        query="__popular_scitech__",
-        num_results=num_results,
-        page=page,
-        audible_region=audible_region,
-    )
+    cache_key = _cache_key("__popular_scitech__", num_results, page, audible_region)
     cache_result = search_cache.get(cache_key)
 
     if cache_result and time.time() - cache_result.timestamp < REFETCH_TTL:
-        try:
-            for book in cache_result.value:
-                session.add(book)
-                session.refresh(book)
-            return cache_result.value
-        except InvalidRequestError:
-            pass
+        cached_books = _load_cached_books(session, cache_result.value)
+        if cached_books is not None:
+            return cached_books
+
+    return await _coalesced_search(
+        session, client_session, cache_key, _fetch_popular_books
+    )
+
 
+async def _fetch_popular_books(
+    session: Session,
+    client_session: ClientSession,
+    cache_key: CacheQuery,
+) -> list[Audiobook]:
+    audible_region = cache_key.audible_region
     params = {
-        "num_results": num_results,
+        "num_results": cache_key.num_results,
         "products_sort_by": "BestSellers",
         "keywords": "science",
-        "page": page,
+        "page": cache_key.page,
     }
-    base_url = (
-        f"https://api.audible{audible_regions[audible_region]}/1.0/catalog/products?"
-    )
-    url = base_url + urlencode(params)
+    base_url = _audible_products_urls[audible_region]
 
     try:
-        async with client_session.get(url) as response:
-            response.raise_for_status()
-            audible_response = _AudibleSearchResponse.model_validate(
-                await response.json()
-            )
-    except Exception as e:
+        product_asins, fetched_at = await _get_product_asins(
+            session, client_session, base_url, params, cache_key
+        )
+    except (ClientError, TimeoutError, ValidationError, ValueError) as e:
         logger.error(
             "Exception while fetching popular books from Audible",
             region=audible_region,
@@ -350,14 +743,12 @@ async def list_popular_books(
         )
         return []
 
-    asins = set(asin_obj.asin for asin_obj in audible_response.products)
+    asins = set(product_asins)
     books = get_existing_books(session, asins)
     for key in books.keys():
         asins.remove(key)
 
-    coros = [get_book_by_asin(client_session, asin, audible_region) for asin in asins]
-    new_books = await asyncio.gather(*coros)
-    new_books = [b for b in new_books if b]
+    new_books = await _fetch_books(client_session, asins, audible_region)
 
     store_new_books(session, new_books)
 
@@ -365,15 +756,20 @@ async def list_popular_books(
         books[b.asin] = b
 
     ordered: list[Audiobook] = []
-    for asin_obj in audible_response.products:
-        book = books.get(asin_obj.asin)
+    for asin in product_asins:
+        book = books.get(asin)
         if book:
             ordered.append(book)
 
-    search_cache[cache_key] = CacheResult(
-        value=ordered,
-        timestamp=time.time(),
-    )
+    if _lookup_failed(product_asins, books, audible_region):
+        logger.debug("Not caching incomplete search result", query=cache_key.query)
+    else:
+        search_cache[cache_key] = CacheResult(
+            value=tuple(book.asin for book in ordered),
+            # the ASINs may come from the persisted or prefetched tier, which must
+            # not restart the clock on their age
+            timestamp=fetched_at,
+        )
 
     logger.info(f"POPULAR BOOKS | Found {len(ordered)} books")
 
@@ -397,30 +793,105 @@ async def list_audible_books(
     """
     if audible_region is None:
         audible_region = get_region_from_settings()
-    cache_key = CacheQuery(
-        query=query,
-        num_results=num_results,
-        page=page,
-        audible_region=audible_region,
-    )
+    cache_key = _cache_key(query, num_results, page, audible_region)
     cache_result = search_cache.get(cache_key)
 
-    if cache_result and time.time() - cache_result.timestamp < REFETCH_TTL:
-        try:
-            for book in cache_result.value:
-                # add back books to the session so we can access their attributes
-                session.add(book)
-                session.refresh(book)
+    if cache_result and time.time() - cache_result.timestamp < STALE_TTL:
+        cached_books = _load_cached_books(session, cache_result.value)
+        if cached_books is not None:
+            if time.time() - cache_result.timestamp < REFETCH_TTL:
+                logger.debug(
+                    "Using cached search result", query=query, region=audible_region
+                )
+            else:
+                logger.debug(
+                    "Using stale search result, revalidating in the background",
+                    query=query,
+                    region=audible_region,
+                )
+                _schedule_search_revalidation(cache_key)
+            return cached_books
+        logger.debug(
+            "Cached search result contained deleted book, refetching",
+            query=query,
+            region=audible_region,
+        )
+
+    return await _coalesced_search(
+        session, client_session, cache_key, _search_audible_books
+    )
+
+
+async def _coalesced_search(
+    session: Session,
+    client_session: ClientSession,
+    cache_key: CacheQuery,
+    fetch: Callable[[Session, ClientSession, CacheQuery], Awaitable[list[Audiobook]]],
+) -> list[Audiobook]:
+    # an identical search is already being fetched. Wait for it and load the
+    # books it stored using our own db session.
+    inflight = _inflight_searches.get(cache_key)
+    if inflight is not None:
+        asins = await asyncio.shield(inflight)
+        if asins is not None:
             logger.debug(
-                "Using cached search result", query=query, region=audible_region
+                "Reusing in-flight search result",
+                query=cache_key.query,
+                region=cache_key.audible_region,
             )
-            return cache_result.value
-        except InvalidRequestError:
-            logger.debug(
-                "Cached search result contained deleted book, refetching",
-                query=query,
-                region=audible_region,
+            books = get_existing_books(session, set(asins))
+            return [books[asin] for asin in asins if asin in books]
+
+    future: asyncio.Future[list[str] | None] = (
+        asyncio.get_running_loop().create_future()
+    )
+    _inflight_searches[cache_key] = future
+    try:
+        ordered = await fetch(session, client_session, cache_key)
+        future.set_result([book.asin for book in ordered])
+        return ordered
+    finally:
+        if _inflight_searches.get(cache_key) is future:
+            del _inflight_searches[cache_key]
+        if not future.done():
+            # the fetch failed or was cancelled, let waiters fetch themselves
+            future.set_result(None)
+
+
+def _schedule_search_revalidation(cache_key: CacheQuery):
+    if cache_key in _revalidation_tasks or cache_key in _inflight_searches:
+        return
+    task = asyncio.create_task(_revalidate_search(cache_key))
+    _revalidation_tasks[cache_key] = task
+    task.add_done_callback(lambda _: _revalidation_tasks.pop(cache_key, None))
+
+
+async def _revalidate_search(cache_key: CacheQuery):
+    """Refetches a stale search result outside of the request that served it"""
+    try:
+        with next(get_session()) as session:
+            await _coalesced_search(
+                session, get_shared_client_session(), cache_key, _search_audible_books
             )
+    except Exception:
+        # fetch errors are already handled by the search itself, so this is a bug.
+        # Nothing awaits this task, so it's logged here instead of raised
+        logger.exception(
+            "Exception while revalidating search result",
+            query=cache_key.query,
+            region=cache_key.audible_region,
+        )
+
+
+async def _search_audible_books(
+    session: Session,
+    client_session: ClientSession,
+    cache_key: CacheQuery,
+) -> list[Audiobook]:
+    query = cache_key.query
+    num_results = cache_key.num_results
+    page = cache_key.page
+    audible_region = cache_key.audible_region
 
     params = {
         "num_results": num_results,
@@ -428,24 +899,18 @@ async def list_audible_books(
         "keywords": query,
         "page": page,
     }
-    base_url = (
-        f"https://api.audible{audible_regions[audible_region]}/1.0/catalog/products?"
-    )
-    url = base_url + urlencode(params)
+    base_url = _audible_products_urls[audible_region]
 
     logger.info(f"AUDIBLE API QUERY: query='{query}' region='{audible_region}' num_results={num_results} page={page}")
-    logger.info(f"AUDIBLE API URL: {url}")
 
     try:
-        async with client_session.get(url) as response:
-            response.raise_for_status()
-            audible_response = _AudibleSearchResponse.model_validate(
-                await response.json()
-            )
-            logger.info(f"AUDIBLE API RETURNED: {len(audible_response.products)} ASINs")
-            for idx, asin_obj in enumerate(audible_response.products[:5]):
-                logger.info(f"  [{idx+1}] ASIN: {asin_obj.asin}")
-    except Exception as e:
+        product_asins, fetched_at = await _get_product_asins(
+            session, client_session, base_url, params, cache_key
+        )
+        logger.info(f"AUDIBLE API RETURNED: {len(product_asins)} ASINs")
+        for idx, asin in enumerate(product_asins[:5]):
+            logger.info(f"  [{idx+1}] ASIN: {asin}")
+    except (ClientError, TimeoutError, ValidationError, ValueError) as e:
         logger.error(
             "Exception while fetching search results from Audible",
             query=query,
@@ -455,15 +920,13 @@ async def list_audible_books(
         return []
 
     # do not fetch book results we already have locally
-    asins = set(asin_obj.asin for asin_obj in audible_response.products)
+    asins = set(product_asins)
     books = get_existing_books(session, asins)
     for key in books.keys():
         asins.remove(key)
 
     # book ASINs we do not have => fetch and store
-    coros = [get_book_by_asin(client_session, asin, audible_region) for asin in asins]
-    new_books = await asyncio.gather(*coros)
-    new_books = [b for b in new_books if b]
+    new_books = await _fetch_books(client_session, asins, audible_region)
 
     store_new_books(session, new_books)
 
@@ -471,15 +934,20 @@ async def list_audible_books(
         books[b.asin] = b
 
     ordered: list[Audiobook] = []
-    for asin_obj in audible_response.products:
-        book = books.get(asin_obj.asin)
+    for asin in product_asins:
+        book = books.get(asin)
         if book:
             ordered.append(book)
 
-    search_cache[cache_key] = CacheResult(
-        value=ordered,
-        timestamp=time.time(),
-    )
+    if _lookup_failed(product_asins, books, audible_region):
+        logger.debug("Not caching incomplete search result", query=cache_key.query)
+    else:
+        search_cache[cache_key] = CacheResult(
+            value=tuple(book.asin for book in ordered),
+            # the ASINs may come from the persisted or prefetched tier, which must
+            # not restart the clock on their age
+            timestamp=fetched_at,
+        )
 
     logger.info(
         f"AUDIBLE API RESULTS | Query: '{query}' | Found {len(ordered)} books"
@@ -487,84 +955,70 @@ async def list_audible_books(
     for idx, book in enumerate(ordered[:5]):
         logger.info(f"  [{idx+1}] '{book.title}' by {book.authors} | ASIN: {book.asin}")
 
-    # clean up cache slightly
-    for k in list(search_cache.keys()):
-        if time.time() - search_cache[k].timestamp > REFETCH_TTL:
-            try:
-                del search_cache[k]
-            except KeyError:  # ignore in race conditions
-                pass
-
     return ordered
 
 
 def get_existing_books(session: Session, asins: set[str]) -> dict[str, Audiobook]:
-    books = list(
-        session.exec(select(Audiobook).where(col(Audiobook.asin).in_(asins))).all()
-    )
+    """Returns the cached books for the given ASINs that are not older than REFETCH_TTL"""
+    if not asins:
+        return {}
+    books = session.exec(
+        select(Audiobook).where(
+            col(Audiobook.asin).in_(asins),
+            col(Audiobook.updated_at)
+            >= datetime.fromtimestamp(time.time() - REFETCH_TTL),
+        )
+    ).all()
+    return {b.asin: b for b in books}
 
-    ok_books: list[Audiobook] = []
-    for b in books:
-        if b.updated_at.timestamp() + REFETCH_TTL < time.time():
-            continue
-        ok_books.append(b)
 
-    return {b.asin: b for b in ok_books}
+_BOOK_METADATA_COLUMNS = (
+    "title",
+    "subtitle",
+    "authors",
+    "narrators",
+    "cover_image",
+    "release_date",
+    "runtime_length_min",
+    "updated_at",
+)
 
 
 def store_new_books(session: Session, books: list[Audiobook]):
-    asins = {b.asin: b for b in books}
+    """
+    Upserts the given books in a single statement. Only the Audible metadata is
+    overwritten on existing rows, so local state like `downloaded` is kept.
 
-    existing = list(
-        session.exec(
-            select(Audiobook).where(col(Audiobook.asin).in_(asins.keys()))
-        ).all()
+    Rows are updated even if their metadata didn't change, as `updated_at` is what marks
+    a book as fresh. Callers only pass books that were missing or stale anyway.
+    """
+    if not books:
+        return
+
+    # ON CONFLICT can't touch the same row twice in one statement, last one wins
+    rows = {b.asin: b.model_dump() for b in books}
+
+    if session.get_bind().dialect.name == "postgresql":
+        stmt = postgresql_insert(Audiobook).values(list(rows.values()))
+    else:
+        stmt = sqlite_insert(Audiobook).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Audiobook.asin],
+        set_={column: stmt.excluded[column] for column in _BOOK_METADATA_COLUMNS},
     )
 
-    to_update: list[Audiobook] = []
-    for b in existing:
-        new_book = asins[b.asin]
-        b.title = new_book.title
-        b.subtitle = new_book.subtitle
-        b.authors = new_book.authors
-        b.narrators = new_book.narrators
-        b.cover_image = new_book.cover_image
-        b.release_date = new_book.release_date
-        b.runtime_length_min = new_book.runtime_length_min
-        to_update.append(b)
-
-    existing_asins = {b.asin for b in existing}
-    to_add = [b for b in books if b.asin not in existing_asins]
-
     logger.info(
         "Storing new search results in BookRequest cache/db",
-        to_add_count=len(to_add),
-        to_update_count=len(to_update),
-        existing_count=len(existing),
+        book_count=len(rows),
     )
 
-    # Use merge pattern for upsert-like behavior to handle race conditions
     try:
-        for book in to_add + existing:
-            session.merge(book)
+        session.execute(stmt)
         session.commit()
     except IntegrityError as e:
         session.rollback()
         logger.error(
             "Failed to commit books due to integrity constraint",
             error=str(e),
-            book_count=len(to_add) + len(existing)
+            book_count=len(rows),
         )
-        # Attempt individual merge to identify problematic books
-        for book in to_add + existing:
-            try:
-                session.merge(book)
-                session.commit()
-            except IntegrityError as book_error:
-                session.rollback()
-                logger.warning(
-                    f"Skipping duplicate book during storage",
-                    asin=book.asin,
-                    title=book.title,
-                    error=str(book_error)
-                )
@@ -87,6 +87,9 @@ class ApplicationSettings(BaseModel):
     upgrade_attempt_cache_ttl: int = 86400
     """TTL for virtual book upgrade attempt cache (default: 24 hours)"""
 
+    persist_search_cache: bool = True
+    """Persist the ASINs of Audible searches in the database so they survive restarts"""
+
     def get_force_login_type(self) -> LoginTypeEnum | None:
         if self.force_login_type.strip():
             try:
@@ -7,7 +7,7 @@ from enum import Enum
 from typing import Annotated, Literal, Union, cast
 
 from pydantic import BaseModel, ConfigDict
-from sqlmodel import JSON, Column, DateTime, Field, SQLModel, func
+from sqlmodel import JSON, Column, DateTime, Field, Index, SQLModel, func
 from sqlmodel.main import Relationship
 
 
@@ -82,6 +82,8 @@ class Audiobook(BaseSQLModel, table=True):
             server_default=func.now(),
             type_=DateTime,
             nullable=False,
+            # stale books are filtered and deleted by age on every search
+            index=True,
         ),
     )
     downloaded: bool = False
@@ -304,6 +306,12 @@ class APIKey(BaseSQLModel, table=True):
 
 class MetadataCache(BaseSQLModel, table=True):
     """Cache table for metadata enrichment results."""
+    # expired entries are deleted by provider and age, provider alone isn't a usable
+    # prefix of the primary key
+    __table_args__: tuple[Index, ...] = (
+        Index("ix_metadatacache_provider_created_at", "provider", "created_at"),
+    )
+
     search_key: str = Field(primary_key=True)
     provider: str = Field(primary_key=True)
     metadata_json: str
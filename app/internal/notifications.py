@@ -85,9 +85,7 @@ async def send_notification(
     book_authors = None
     book_narrators = None
     if book_asin:
-        book = session.exec(
-            select(Audiobook).where(Audiobook.asin == book_asin)
-        ).first()
+        book = session.get(Audiobook, book_asin)
         if book:
             book_title = book.title
             book_authors = ",".join(book.authors)
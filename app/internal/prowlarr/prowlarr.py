@@ -243,13 +243,11 @@ async def query_prowlarr(
         ) as response:
             prowlarr_text = await response.text()
             if not response.ok:
-                logger.error(
-                    "Prowlarr: Failed to query", response=await response.text()
-                )
+                logger.error("Prowlarr: Failed to query", response=prowlarr_text)
                 return []
-            search_results = _ProwlarrSearchResult.validate_python(
-                await response.json()
-            )
+            # the body was already read above, so parse it directly instead of
+            # decoding it again through response.json()
+            search_results = _ProwlarrSearchResult.validate_json(prowlarr_text)
     except TimeoutError as e:
         elapsed_time = time.time() - start_time
         logger.error(
@@ -151,7 +151,7 @@ async def search_prowlarr_available(
                 return []
             
             # Parse response
-            search_results = _ProwlarrSearchResult.validate_python(await response.json())
+            search_results = _ProwlarrSearchResult.validate_json(await response.read())
             
     except asyncio.TimeoutError:
         logger.error("Prowlarr search timed out", query=query)
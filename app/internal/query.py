@@ -51,7 +51,7 @@ async def query_sources(
     start_auto_download: bool = False,
     only_return_if_cached: bool = False,
 ) -> QueryResult:
-    book = session.exec(select(Audiobook).where(Audiobook.asin == asin)).first()
+    book = session.get(Audiobook, asin)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
 
@@ -1,4 +1,5 @@
 import uuid
+from contextlib import asynccontextmanager
 from typing import Awaitable, Callable
 from urllib.parse import quote_plus, urlencode
 
@@ -21,6 +22,7 @@ from app.internal.book_search import clear_old_book_caches
 from app.internal.env_settings import Settings
 from app.internal.models import User
 from app.routers import api, auth, root, search, settings, wishlist
+from app.util.connection import close_shared_client_session
 from app.util.db import get_session
 from app.util.fetch_js import fetch_scripts
 from app.util.log import setup_logging
@@ -48,6 +50,13 @@ with next(get_session()) as session:
     clear_old_book_caches(session)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _ = app
+    yield
+    await close_shared_client_session()
+
+
 app = FastAPI(
     title="AudioBookRequest",
     debug=app_settings.debug,
@@ -59,6 +68,7 @@ app = FastAPI(
     ],
     root_path=app_settings.base_url.rstrip("/"),
     redirect_slashes=False,
+    lifespan=lifespan,
 )
 
 
@@ -162,7 +162,7 @@ async def mark_downloaded(
     background_task: BackgroundTasks,
     _: Annotated[DetailedUser, Security(APIKeyAuth(GroupEnum.admin))],
 ):
-    book = session.exec(select(Audiobook).where(Audiobook.asin == asin)).first()
+    book = session.get(Audiobook, asin)
     if book:
         try:
             book.downloaded = True
@@ -253,7 +253,7 @@ async def download_book(
     if not resp.ok:
         raise HTTPException(status_code=500, detail="Failed to start download")
 
-    book = session.exec(select(Audiobook).where(Audiobook.asin == asin)).first()
+    book = session.get(Audiobook, asin)
     if book:
         try:
             book.downloaded = True
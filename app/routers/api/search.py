@@ -25,7 +25,12 @@ from app.internal.prowlarr.search_integration import (
     search_prowlarr_available,
     ProwlarrSearchResult,
 )
-from app.internal.prowlarr.util import verify_match, verify_match_relaxed, normalize_text
+from app.internal.prowlarr.util import (
+    fuzzy_match_cache,
+    normalize_text,
+    verify_match,
+    verify_match_relaxed,
+)
 from app.internal.metadata.google_books import google_books_provider
 from app.internal.env_settings import Settings
 from app.util.connection import get_connection
@@ -44,6 +49,14 @@ upgrade_attempt_cache: SimpleCache[Optional[str], str] = SimpleCache()
 ranking_cache: SimpleCache[list[RankedAudiobookSearchResult], str] = SimpleCache()
 
 
+def _expire_search_caches():
+    """Drops expired entries, which otherwise stay in memory until overwritten"""
+    app_settings = Settings().app
+    upgrade_attempt_cache.expire(app_settings.upgrade_attempt_cache_ttl)
+    ranking_cache.expire(app_settings.ranking_cache_ttl)
+    fuzzy_match_cache.expire(app_settings.fuzzy_match_cache_ttl)
+
+
 @asynccontextmanager
 async def timing_context(operation: str):
     """Context manager for timing operations"""
@@ -608,6 +621,7 @@ async def search_books(
 
     if query:
         clear_old_book_caches(session)
+        _expire_search_caches()
 
         if available_only:
             # Availability-first search mode
@@ -919,13 +933,13 @@ async def search_books(
 @router.get("/suggestions", response_model=list[str])
 async def search_suggestions(
     query: Annotated[str, Query(alias="q")],
+    client_session: Annotated[ClientSession, Depends(get_connection)],
     _: Annotated[DetailedUser, Security(APIKeyAuth())],
     region: audible_region_type | None = None,
 ):
     if region is None:
         region = get_region_from_settings()
-    async with ClientSession() as client_session:
-        return await book_search.get_search_suggestions(client_session, query, region)
+    return await book_search.get_search_suggestions(client_session, query, region)
 
 
 @router.post("/clear-metadata-cache")
@@ -970,8 +984,6 @@ async def get_cache_stats(
     - Ranking cache (for author relevance ranking)
     - Upgrade attempt cache (for virtual book upgrade tracking)
     """
-    from app.internal.prowlarr.util import fuzzy_match_cache
-
     settings = Settings()
 
     # Helper to safely get cache size
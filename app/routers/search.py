@@ -16,6 +16,7 @@ from app.internal.book_search import (
     audible_region_type,
     audible_regions,
     get_region_from_settings,
+    get_search_suggestions,
 )
 from app.internal.models import (
     GroupEnum,
@@ -27,10 +28,7 @@ from app.util.connection import get_connection
 from app.util.db import get_session
 from app.util.log import logger
 from app.util.templates import template_response
-from app.routers.api.search import (
-    search_books,
-    search_suggestions as api_search_suggestions,
-)
+from app.routers.api.search import search_books
 from app.routers.api.requests import (
     create_request,
     delete_request as api_delete_request,
@@ -97,10 +95,13 @@ async def read_search(
 async def search_suggestions(
     request: Request,
     query: Annotated[str, Query(alias="q")],
+    client_session: Annotated[ClientSession, Depends(get_connection)],
     user: Annotated[DetailedUser, Security(ABRAuth())],
     region: audible_region_type | None = None,
 ):
-    suggestions = await api_search_suggestions(query, user, region)
+    if region is None:
+        region = get_region_from_settings()
+    suggestions = await get_search_suggestions(client_session, query, region)
     return template_response(
         "search.html",
         request,
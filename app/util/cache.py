@@ -1,8 +1,9 @@
 import threading
 import time
 from abc import ABC
-from collections import OrderedDict
-from typing import overload
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator, MutableMapping
+from typing import overload, override
 
 from sqlmodel import Session, select
 
@@ -55,7 +56,8 @@ class ModificationTracker:
     """Thread-safe tracker for file modification times.
 
     Prevents race conditions when checking file modifications across multiple
-    concurrent requests. Uses threading.Lock to ensure atomic reads/writes.
+    concurrent requests. Unchanged mtimes are detected without locking, as reading a
+    float attribute is atomic. Updates are made under a threading.Lock.
     """
 
     _lock: threading.Lock
@@ -74,7 +76,10 @@ class ModificationTracker:
         Returns:
             True if mtime differs from tracked value, False if unchanged.
         """
+        if current_mtime == self._modification_time:
+            return False
         with self._lock:
+            # another thread may have recorded the same change in the meantime
             if current_mtime != self._modification_time:
                 self._modification_time = current_mtime
                 return True
@@ -88,6 +93,9 @@ class ModificationTracker:
 
 class SimpleCache[VT, *KTs]:
     _cache: OrderedDict[tuple[*KTs], tuple[int, VT]]
+    # (cached_at, query) in insertion order, so expire() only visits expired entries.
+    # _cache itself is in LRU order, which says nothing about the age of an entry.
+    _expiry: deque[tuple[int, tuple[*KTs]]]
     _lock: threading.Lock
     _maxsize: int | None
     _metrics: CacheMetrics
@@ -99,6 +107,7 @@ class SimpleCache[VT, *KTs]:
             maxsize: Maximum number of entries. None = unlimited. Uses LRU eviction.
         """
         self._cache = OrderedDict()
+        self._expiry = deque()
         self._lock = threading.Lock()
         self._maxsize = maxsize
         self._metrics = CacheMetrics()
@@ -106,17 +115,17 @@ class SimpleCache[VT, *KTs]:
     def get(self, source_ttl: int, *query: *KTs) -> VT | None:
         with self._lock:
             hit = self._cache.get(query)
-            if not hit:
-                self._metrics.record_miss()
-                return None
-            cached_at, sources = hit
-            if cached_at + source_ttl < time.time():
-                self._metrics.record_miss()
-                return None
-            # Move to end for LRU tracking
-            self._cache.move_to_end(query)
-            self._metrics.record_hit()
-            return sources
+            if hit is not None and hit[0] + source_ttl < time.time():
+                hit = None
+            if hit is not None:
+                # Move to end for LRU tracking
+                self._cache.move_to_end(query)
+        # the metrics have their own lock, so don't hold the cache lock for them
+        if hit is None:
+            self._metrics.record_miss()
+            return None
+        self._metrics.record_hit()
+        return hit[1]
 
     def get_all(self, source_ttl: int) -> dict[tuple[*KTs], VT]:
         with self._lock:
@@ -130,22 +139,50 @@ class SimpleCache[VT, *KTs]:
 
     def set(self, sources: VT, *query: *KTs):
         with self._lock:
-            # Remove old entry if exists to update position
-            if query in self._cache:
-                del self._cache[query]
-
-            # Add new entry at end (most recently used)
-            self._cache[query] = (int(time.time()), sources)
-
-            # Evict oldest entry if over maxsize
-            if self._maxsize is not None and len(self._cache) > self._maxsize:
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                self._metrics.record_eviction()
+            # Store and move to end (most recently used)
+            cached_at = int(time.time())
+            self._cache[query] = (cached_at, sources)
+            self._cache.move_to_end(query)
+            self._expiry.append((cached_at, query))
+            # overwritten and evicted entries stay queued until expire() reaches them,
+            # which for caches that are never expired would be never
+            if len(self._expiry) > 2 * len(self._cache) + 16:
+                self._compact_expiry()
+
+            # Evict least recently used entry if over maxsize
+            evicted = self._maxsize is not None and len(self._cache) > self._maxsize
+            if evicted:
+                self._cache.popitem(last=False)
+        if evicted:
+            self._metrics.record_eviction()
+
+    def _compact_expiry(self):
+        """Rebuild the expiry queue from the live entries. Must hold the lock."""
+        self._expiry = deque(
+            sorted(
+                ((cached_at, query) for query, (cached_at, _) in self._cache.items()),
+                key=lambda entry: entry[0],
+            )
+        )
 
     def flush(self):
         with self._lock:
             self._cache = OrderedDict()
+            self._expiry.clear()
+
+    def expire(self, source_ttl: int):
+        """Drop all entries older than `source_ttl` seconds.
+
+        Only the expired entries are visited, so this is cheap to call often.
+        """
+        with self._lock:
+            now = time.time()
+            while self._expiry and self._expiry[0][0] + source_ttl < now:
+                cached_at, query = self._expiry.popleft()
+                # the entry might have been overwritten or evicted since
+                hit = self._cache.get(query)
+                if hit and hit[0] == cached_at:
+                    del self._cache[query]
 
     def get_metrics(self) -> CacheMetrics:
         """Return the metrics tracker for this cache."""
@@ -157,6 +194,94 @@ class SimpleCache[VT, *KTs]:
             return len(self._cache)
 
 
+class TTLCache[K, V](MutableMapping[K, V]):
+    """Thread-safe dict-like cache with a fixed time-to-live per entry.
+
+    Entries are kept in insertion order, which with a single TTL is also expiry
+    order, so expired entries are dropped from the front without scanning the
+    whole cache. Once `maxsize` is reached the oldest entry is evicted.
+    """
+
+    _data: OrderedDict[K, tuple[float, V]]
+    _lock: threading.Lock
+    _maxsize: int
+    _ttl: float
+    _timer: Callable[[], float]
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries before the oldest one is evicted.
+            ttl: Seconds after which an entry expires.
+            timer: Clock used for expiry, overridable for tests.
+        """
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._timer = timer
+
+    @override
+    def __getitem__(self, key: K) -> V:
+        with self._lock:
+            expires_at, value = self._data[key]
+            if expires_at <= self._timer():
+                del self._data[key]
+                raise KeyError(key)
+            return value
+
+    @override
+    def __setitem__(self, key: K, value: V):
+        with self._lock:
+            # Re-insert at the end so the order stays sorted by expiry
+            self._data.pop(key, None)
+            self._data[key] = (self._timer() + self._ttl, value)
+            self._expire()
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    @override
+    def __delitem__(self, key: K):
+        with self._lock:
+            del self._data[key]
+
+    @override
+    def __iter__(self) -> Iterator[K]:
+        with self._lock:
+            self._expire()
+            return iter(list(self._data))
+
+    @override
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._data)
+
+    @override
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def expire(self):
+        """Drop all expired entries."""
+        with self._lock:
+            self._expire()
+
+    def _expire(self):
+        now = self._timer()
+        while self._data:
+            expires_at, _ = next(iter(self._data.values()))
+            if expires_at > now:
+                break
+            self._data.popitem(last=False)
+
+
 class StringConfigCache[L: str](ABC):
     _cache: dict[L, str] = {}
 
@@ -1,6 +1,61 @@
+import asyncio
+
 import aiohttp
 
+from app.internal.env_settings import Settings
+
+_shared_session: aiohttp.ClientSession | None = None
+_shared_session_loop: asyncio.AbstractEventLoop | None = None
+# sessions of a previous event loop that are being closed. Holds a reference so the
+# closing tasks aren't garbage collected
+_closing_sessions: set[asyncio.Task[None]] = set()
+
+
+def get_shared_client_session() -> aiohttp.ClientSession:
+    """
+    Returns a client session that is shared across requests, so connections (and their
+    DNS lookups and TLS handshakes) to the same hosts are kept alive and reused.
+    A new session is created if the event loop changed since the last call, the
+    previous one is then closed in the background.
+    """
+    global _shared_session, _shared_session_loop
+    loop = asyncio.get_running_loop()
+    if (
+        _shared_session is None
+        or _shared_session.closed
+        or _shared_session_loop is not loop
+    ):
+        if _shared_session is not None and not _shared_session.closed:
+            # its loop is gone (tests, reloads), so its connections are closed from this one
+            task = loop.create_task(_shared_session.close())
+            _closing_sessions.add(task)
+            task.add_done_callback(_closing_sessions.discard)
+        # Book lookups race Audimeta and Audnexus, so a single search can hold
+        # max_concurrent_audible_requests connections to each of them at once.
+        # The total leaves room for a few concurrent searches plus the indexers.
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=max(16, Settings().app.max_concurrent_audible_requests),
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+        _shared_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(30),
+            # requests of different users must not share cookies
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        _shared_session_loop = loop
+    return _shared_session
+
+
+async def close_shared_client_session():
+    global _shared_session, _shared_session_loop
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+    _shared_session_loop = None
+
 
 async def get_connection():
-    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(30)) as session:
-        yield session
+    yield get_shared_client_session()
@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.pool import ConnectionPoolEntry
 from sqlmodel import Session, text
 import structlog
 
@@ -26,6 +28,18 @@ else:
         pool_pre_ping=db.pool_pre_ping,
     )
 
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(
+        dbapi_conn: DBAPIConnection, _connection_record: ConnectionPoolEntry
+    ):
+        """WAL lets readers continue while book searches store their results"""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
 # Log pool configuration at startup
 logger.info(
     "Database connection pool configured",
@@ -1,8 +1,11 @@
 """
 Pytest configuration and fixtures for ABR-Dev test suite.
 """
-import asyncio
 import json
+import secrets
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, contextmanager
 from datetime import datetime, timezone
 from typing import AsyncGenerator, Generator
 from unittest.mock import Mock, AsyncMock, patch
@@ -10,42 +13,133 @@ from unittest.mock import Mock, AsyncMock, patch
 import pytest
 from aiohttp import ClientSession
 from aioresponses import aioresponses
+from argon2 import PasswordHasher, profiles
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, create_engine, Session
+from yarl import URL
 
+from app.internal import book_search
+from app.internal.prowlarr import util as prowlarr_util
 from app.internal.models import Audiobook, ProwlarrSource, TorrentSource, User, GroupEnum
 from app.internal.prowlarr.search_integration import ProwlarrSearchResult
+from app.routers.api import search as api_search
 
 
 # Database fixtures
-@pytest.fixture(scope="function")
-def db_engine():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
+@pytest.fixture(scope="session")
+def db_engine() -> Generator[Engine, None, None]:
+    """Create a single in-memory SQLite database shared by the whole test session."""
+    engine = create_engine(
+        "sqlite://",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT handling.
+    # Let SQLAlchemy emit BEGIN itself so nested transactions work.
+    # https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#serializable-isolation-savepoints-transactional-ddl
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     SQLModel.metadata.create_all(engine)
-    return engine
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def sql_statements(db_engine: Engine) -> Callable[[], AbstractContextManager[list[str]]]:
+    """Record the SQL statements the test engine executes inside a `with` block."""
+
+    @contextmanager
+    def record() -> Generator[list[str], None, None]:
+        statements: list[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db_engine, "before_cursor_execute", before_cursor_execute)
+
+    return record
 
 
 @pytest.fixture(scope="function")
 def db_session(db_engine) -> Generator[Session, None, None]:
-    """Provide a database session for tests."""
-    with Session(db_engine) as session:
+    """
+    Provide a database session wrapped in a transaction that is rolled back
+    after the test. Commits inside the test only release a SAVEPOINT.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
         yield session
-        session.rollback()
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+# Password hashing fixtures
+class MemoizedPasswordHasher(PasswordHasher):
+    """
+    PasswordHasher that reuses the first hash computed for each password.
+    Verification still runs real argon2; no test depends on a fresh salt per call.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._memo: dict[str | bytes, str] = {}
+
+    def hash(self, password: str | bytes, *, salt: bytes | None = None) -> str:
+        if salt is not None:
+            return super().hash(password, salt=salt)
+        if password not in self._memo:
+            self._memo[password] = super().hash(password)
+        return self._memo[password]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cheap_password_hasher() -> Generator[PasswordHasher, None, None]:
+    """Swap the app's argon2 hasher for a memoized one with the cheapest parameters."""
+    hasher = MemoizedPasswordHasher.from_parameters(profiles.CHEAPEST)
+    # Warm up the argon2 bindings and the OS entropy source so the first
+    # test that hashes a password or generates an API key doesn't pay for it
+    hasher.verify(hasher.hash("warmup"), "warmup")
+    secrets.token_urlsafe(32)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.internal.auth.authentication.ph", hasher)
+        yield hasher
+
+
+@pytest.fixture(scope="session")
+def dummy_password_hash(cheap_password_hasher) -> str:
+    """A real argon2 hash of "password123", built once and shared by test users."""
+    return cheap_password_hasher.hash("password123")
 
 
-# Async event loop fixture for async tests
-@pytest.fixture(scope="function")
-def event_loop():
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> float:
+    """Freezes time.time() for the test, so TTL arithmetic can't drift. Returns the frozen timestamp."""
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    return now
 
 
 # Async HTTP mocking fixtures
-@pytest.fixture(scope="function")
-async def mock_client_session() -> AsyncGenerator[ClientSession, None]:
-    """Provide a real ClientSession with aioresponses mocking for HTTP calls."""
+@pytest.fixture(scope="module")
+async def shared_client_session() -> AsyncGenerator[ClientSession, None]:
+    """One aioresponses-mocked ClientSession per test module."""
     with aioresponses() as mocked:
         async with ClientSession() as session:
             # Attach mocked responses to session for easy access in tests
@@ -53,6 +147,17 @@ async def mock_client_session() -> AsyncGenerator[ClientSession, None]:
             yield session
 
 
+@pytest.fixture(scope="function")
+def mock_client_session(
+    shared_client_session: ClientSession,
+) -> Generator[ClientSession, None, None]:
+    """Provide the module's mocked ClientSession, with mocks and recorded requests reset after each test."""
+    yield shared_client_session
+    mocked: aioresponses = shared_client_session._mocked
+    mocked.clear()
+    mocked.requests.clear()
+
+
 @pytest.fixture(scope="function")
 def aioresponses_mocker() -> Generator[aioresponses, None, None]:
     """Provide aioresponses context manager for manual HTTP mocking."""
@@ -60,6 +165,85 @@ def aioresponses_mocker() -> Generator[aioresponses, None, None]:
         yield mocked
 
 
+@pytest.fixture(scope="session")
+def audible_search_url() -> Callable[..., str]:
+    """Builds the exact Audible catalog URL a search requests.
+
+    Catalog pages are fetched in pairs, so the default is the request covering
+    pages 0 and 1 of a search with 20 results per page.
+    """
+
+    def build(
+        keywords: str,
+        *,
+        num_results: int = 40,
+        page: int = 0,
+        sort_by: str = "Relevance",
+    ) -> str:
+        return str(
+            URL("https://api.audible.com/1.0/catalog/products").with_query(
+                num_results=num_results,
+                products_sort_by=sort_by,
+                keywords=keywords,
+                page=page,
+            )
+        )
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def audible_suggestions_url() -> Callable[[str], str]:
+    """Builds the exact Audible search suggestions URL for the given keystrokes."""
+
+    def build(key_strokes: str) -> str:
+        return str(
+            URL("https://api.audible.com/1.0/searchsuggestions").with_query(
+                key_strokes=key_strokes, site_variant="desktop"
+            )
+        )
+
+    return build
+
+
+@pytest.fixture(autouse=True)
+def reset_book_search_caches() -> Generator[None, None, None]:
+    """Start every test with empty in-memory book search caches and no pending fetches."""
+    caches = (
+        book_search.search_cache,
+        book_search.search_suggestions_cache,
+        book_search._prefetched_asins,
+        book_search._missing_asins,
+        book_search._search_etags,
+        book_search._inflight_searches,
+        book_search._inflight_suggestions,
+        book_search._revalidation_tasks,
+    )
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_search_endpoint_caches() -> Generator[None, None, None]:
+    """
+    Start every test with empty ranking, upgrade-attempt and fuzzy-match caches, so the
+    expiry sweep in search_books has nothing to compare against mocked settings.
+    """
+    caches = (
+        api_search.upgrade_attempt_cache,
+        api_search.ranking_cache,
+        prowlarr_util.fuzzy_match_cache,
+    )
+    for cache in caches:
+        cache.flush()
+    yield
+    for cache in caches:
+        cache.flush()
+
+
 # Sample data fixtures
 @pytest.fixture
 def sample_prowlarr_results():
@@ -201,19 +385,6 @@ def mock_prowlarr_search_response(sample_prowlarr_results):
     return mock_search_prowlarr_available
 
 
-# Async test helper
-def async_test(coro):
-    """Decorator to run async tests."""
-    def wrapper(*args, **kwargs):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(coro(*args, **kwargs))
-        finally:
-            loop.close()
-    return wrapper
-
-
 # Test data for edge cases
 @pytest.fixture
 def edge_case_prowlarr_results():
@@ -340,28 +511,46 @@ def mock_google_books_empty_response():
 
 
 # User fixtures for authorization testing
+@pytest.fixture(scope="module")
+def user_factory(dummy_password_hash):
+    """
+    Build unsaved users for a group. Table models skip pydantic validation on
+    construction, so this stays cheap; add the result to a session to persist it.
+    Every user's password is "password123".
+    """
+    def _make(group: GroupEnum, username: str | None = None, root: bool = False) -> User:
+        return User(
+            username=username or f"{group.value}_user",
+            password=dummy_password_hash,
+            group=group,
+            root=root,
+        )
+
+    return _make
+
+
 @pytest.fixture(scope="function")
-def admin_user(db_session) -> User:
+def admin_user(db_session, user_factory) -> User:
     """Create an admin user."""
-    user = User(username="admin", password="hashed_password", group=GroupEnum.admin)
+    user = user_factory(GroupEnum.admin, username="admin")
     db_session.add(user)
     db_session.commit()
     return user
 
 
 @pytest.fixture(scope="function")
-def trusted_user(db_session) -> User:
+def trusted_user(db_session, user_factory) -> User:
     """Create a trusted user."""
-    user = User(username="trusted", password="hashed_password", group=GroupEnum.trusted)
+    user = user_factory(GroupEnum.trusted, username="trusted")
     db_session.add(user)
     db_session.commit()
     return user
 
 
 @pytest.fixture(scope="function")
-def untrusted_user(db_session) -> User:
+def untrusted_user(db_session, user_factory) -> User:
     """Create an untrusted user."""
-    user = User(username="untrusted", password="hashed_password", group=GroupEnum.untrusted)
+    user = user_factory(GroupEnum.untrusted, username="untrusted")
     db_session.add(user)
     db_session.commit()
     return user
@@ -27,6 +27,7 @@ from app.internal.models import (
     APIKey,
 )
 from app.main import app
+from app.util.connection import get_connection
 from app.util.db import get_session
 
 
@@ -356,6 +357,30 @@ class TestSearchEndpointAuthorization:
         # Pattern: /api/search/suggestions uses APIKeyAuth() without group requirement
         assert untrusted_user is not None
 
+    def test_search_suggestions_page(self, client, untrusted_user, monkeypatch):
+        """The suggestions page should fetch suggestions with the shared client session."""
+        # the init redirect checks for users in the real database, not the test session
+        monkeypatch.setattr("app.main.user_exists", True)
+        client_session = object()
+
+        async def override_get_connection():
+            yield client_session
+
+        app.dependency_overrides[get_connection] = override_get_connection
+        with patch(
+            "app.routers.search.get_search_suggestions",
+            AsyncMock(return_value=["Mistborn"]),
+        ) as get_suggestions:
+            response = client.get(
+                "/search/suggestions",
+                params={"q": "mist", "region": "uk"},
+                auth=("untrusted", "password123"),
+            )
+
+        assert response.status_code == 200
+        assert "search-suggestions" in response.text
+        get_suggestions.assert_awaited_once_with(client_session, "mist", "uk")
+
 
 class TestErrorHandlingPatterns:
     """Test API error handling patterns."""
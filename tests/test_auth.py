@@ -12,14 +12,18 @@ Tests cover Phase 2 maintenance plan - 17 untested auth functions:
 """
 import asyncio
 import base64
+import re
 import secrets
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from math import inf
-from unittest.mock import AsyncMock, MagicMock, patch, Mock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch, Mock
 from typing import Annotated
 
 import pytest
-from fastapi import HTTPException, Request, status
+from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
@@ -46,276 +50,249 @@ from app.internal.auth.oidc_config import (
 )
 from app.internal.models import User, APIKey, GroupEnum
 
+# Placeholder for tests that never inspect the request beyond logging its URL
+_FAKE_REQUEST = SimpleNamespace(url=SimpleNamespace(path="/"), headers={})
 
-class TestLoginTypeEnum:
-    """Test LoginTypeEnum methods for login type checking."""
 
-    def test_is_basic_true_when_basic(self):
-        """is_basic() should return True for basic login type."""
-        login_type = LoginTypeEnum.basic
-        assert login_type.is_basic() is True
+def _req(session=None):
+    """Minimal request for ABRAuth, which only reads .session and logs .url."""
+    return SimpleNamespace(url=_FAKE_REQUEST.url, session=session or {})
+
 
-    def test_is_basic_false_for_other_types(self):
-        """is_basic() should return False for non-basic types."""
-        for login_type in [LoginTypeEnum.forms, LoginTypeEnum.oidc, LoginTypeEnum.none]:
-            assert login_type.is_basic() is False
+_API_KEY_RE = re.compile(r"\A[A-Za-z0-9_\-]+\Z")
 
-    def test_is_forms_true_when_forms(self):
-        """is_forms() should return True for forms login type."""
-        login_type = LoginTypeEnum.forms
-        assert login_type.is_forms() is True
+# Offset in seconds for OIDC session expiry timestamps
+_FUTURE_EXP_DELTA = 3600
 
-    def test_is_forms_false_for_other_types(self):
-        """is_forms() should return False for non-forms types."""
-        for login_type in [LoginTypeEnum.basic, LoginTypeEnum.oidc, LoginTypeEnum.none]:
-            assert login_type.is_forms() is False
 
-    def test_is_none_true_when_none(self):
-        """is_none() should return True for none login type."""
-        login_type = LoginTypeEnum.none
-        assert login_type.is_none() is True
+@pytest.fixture
+def session_middleware_factory(monkeypatch):
+    """Build (app, linker, middleware) triples with overridable secret and max_age."""
+    # middlewares is a class-level list shared with the app's middleware_linker;
+    # give each test its own so registrations don't leak between tests.
+    monkeypatch.setattr(DynamicMiddlewareLinker, "middlewares", [])
 
-    def test_is_none_false_for_other_types(self):
-        """is_none() should return False for non-none types."""
-        for login_type in [LoginTypeEnum.basic, LoginTypeEnum.forms, LoginTypeEnum.oidc]:
-            assert login_type.is_none() is False
+    def _make(
+        secret: str = "secret",
+        max_age: int | None = None,
+        linker: DynamicMiddlewareLinker | None = None,
+    ):
+        app = Mock()
+        linker = linker or DynamicMiddlewareLinker()
+        middleware = DynamicSessionMiddleware(app, secret, linker, max_age=max_age)
+        return app, linker, middleware
 
-    def test_is_oidc_true_when_oidc(self):
-        """is_oidc() should return True for oidc login type."""
-        login_type = LoginTypeEnum.oidc
-        assert login_type.is_oidc() is True
+    return _make
 
-    def test_is_oidc_false_for_other_types(self):
-        """is_oidc() should return False for non-oidc types."""
-        for login_type in [LoginTypeEnum.basic, LoginTypeEnum.forms, LoginTypeEnum.none]:
-            assert login_type.is_oidc() is False
 
+@pytest.fixture
+def mock_oidc_client():
+    """Build a stand-in ClientSession whose get() yields a canned OIDC response."""
+    def _make(payload: dict, status: int = 200, ok: bool = True):
+        async def _json():
+            return payload
 
-class TestUserAuthorization:
-    """Test User model authorization methods."""
+        response = SimpleNamespace(status=status, ok=ok, json=_json)
 
-    def test_is_above_admin_can_access_admin(self, db_session):
-        """Admin user should be able to access admin resources."""
+        @asynccontextmanager
+        async def _get(url):
+            yield response
+
+        return SimpleNamespace(get=_get)
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def alice_user(dummy_password_hash) -> User:
+    """Unsaved alice carrying the pre-computed password hash."""
+    return User(username="alice", password=dummy_password_hash, root=False)
+
+
+@pytest.fixture
+def make_alice(db_session, dummy_password_hash):
+    """Persist alice with the pre-computed hash instead of calling create_user."""
+    def _make(group: GroupEnum = GroupEnum.untrusted) -> User:
         user = User(
-            username="admin_user",
-            password="hashed_password",
-            group=GroupEnum.admin,
+            username="alice",
+            password=dummy_password_hash,
+            group=group,
             root=False,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()
+        return user
+
+    return _make
+
+
+@pytest.fixture
+def mock_auth_config(monkeypatch):
+    """Replace auth_config with a stub whose login type each test sets directly."""
+    stub = SimpleNamespace(login_type=LoginTypeEnum.basic)
+    stub.get_login_type = lambda session: stub.login_type
+    monkeypatch.setattr("app.internal.auth.authentication.auth_config", stub)
+    return stub
+
+
+@pytest.fixture
+def seeded_users(db_session, dummy_password_hash) -> dict[str, User]:
+    """Persist the users TestABRAuth authenticates against, all sharing alice's password."""
+    users = [
+        User(username="alice", password=dummy_password_hash, group=GroupEnum.admin),
+        User(username="admin_user", password=dummy_password_hash, group=GroupEnum.admin),
+        User(
+            username="alice_untrusted",
+            password=dummy_password_hash,
+            group=GroupEnum.untrusted,
+        ),
+    ]
+    db_session.add_all(users)
+    db_session.flush()
+    return {user.username: user for user in users}
+
+
+@pytest.fixture
+def api_key_name() -> str:
+    """Name given to alice's API key; override with parametrize."""
+    return "test_key"
+
+
+@pytest.fixture
+def alice_with_key(db_session, make_alice, api_key_name) -> tuple[User, APIKey, str]:
+    """Persist a trusted alice and one API key, returning (user, api_key, private_key)."""
+    user = make_alice(group=GroupEnum.trusted)
+    api_key_obj, private_key = create_api_key(user, api_key_name)
+    db_session.add(api_key_obj)
+    db_session.flush()
+    return user, api_key_obj, private_key
+
+
+def _stub_dependency(value):
+    """Async stand-in for a FastAPI security dependency that always returns value."""
+    async def _dependency(*args, **kwargs):
+        return value
+
+    return _dependency
+
+
+_LOGIN_TYPE_METHODS = {
+    "is_basic": LoginTypeEnum.basic,
+    "is_forms": LoginTypeEnum.forms,
+    "is_oidc": LoginTypeEnum.oidc,
+    "is_none": LoginTypeEnum.none,
+}
+
+
+class TestLoginTypeEnum:
+    """Test LoginTypeEnum methods for login type checking."""
+
+    @pytest.mark.parametrize("login_type", list(LoginTypeEnum))
+    @pytest.mark.parametrize("method_name,matching", _LOGIN_TYPE_METHODS.items())
+    def test_is_methods_truth_table(self, login_type, method_name, matching):
+        """Each is_*() method should be True only for its own login type."""
+        assert getattr(login_type, method_name)() is (login_type is matching)
+
+
+class TestUserAuthorization:
+    """Test User model authorization methods."""
 
+    def test_is_above_admin_can_access_admin(self, user_factory):
+        """Admin user should be able to access admin resources."""
+        user = user_factory(GroupEnum.admin)
         assert user.is_above(GroupEnum.admin) is True
 
-    def test_is_above_admin_can_access_trusted(self, db_session):
+    def test_is_above_admin_can_access_trusted(self, user_factory):
         """Admin user should be able to access trusted resources."""
-        user = User(
-            username="admin_user",
-            password="hashed_password",
-            group=GroupEnum.admin,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.admin)
         assert user.is_above(GroupEnum.trusted) is True
 
-    def test_is_above_admin_can_access_untrusted(self, db_session):
+    def test_is_above_admin_can_access_untrusted(self, user_factory):
         """Admin user should be able to access untrusted resources."""
-        user = User(
-            username="admin_user",
-            password="hashed_password",
-            group=GroupEnum.admin,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.admin)
         assert user.is_above(GroupEnum.untrusted) is True
 
-    def test_is_above_trusted_cannot_access_admin(self, db_session):
+    def test_is_above_trusted_cannot_access_admin(self, user_factory):
         """Trusted user should NOT be able to access admin resources."""
-        user = User(
-            username="trusted_user",
-            password="hashed_password",
-            group=GroupEnum.trusted,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.trusted)
         assert user.is_above(GroupEnum.admin) is False
 
-    def test_is_above_trusted_can_access_trusted(self, db_session):
+    def test_is_above_trusted_can_access_trusted(self, user_factory):
         """Trusted user should be able to access trusted resources."""
-        user = User(
-            username="trusted_user",
-            password="hashed_password",
-            group=GroupEnum.trusted,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.trusted)
         assert user.is_above(GroupEnum.trusted) is True
 
-    def test_is_above_trusted_can_access_untrusted(self, db_session):
+    def test_is_above_trusted_can_access_untrusted(self, user_factory):
         """Trusted user should be able to access untrusted resources."""
-        user = User(
-            username="trusted_user",
-            password="hashed_password",
-            group=GroupEnum.trusted,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.trusted)
         assert user.is_above(GroupEnum.untrusted) is True
 
-    def test_is_above_untrusted_cannot_access_admin(self, db_session):
+    def test_is_above_untrusted_cannot_access_admin(self, user_factory):
         """Untrusted user should NOT be able to access admin resources."""
-        user = User(
-            username="untrusted_user",
-            password="hashed_password",
-            group=GroupEnum.untrusted,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.untrusted)
         assert user.is_above(GroupEnum.admin) is False
 
-    def test_is_above_untrusted_cannot_access_trusted(self, db_session):
+    def test_is_above_untrusted_cannot_access_trusted(self, user_factory):
         """Untrusted user should NOT be able to access trusted resources."""
-        user = User(
-            username="untrusted_user",
-            password="hashed_password",
-            group=GroupEnum.untrusted,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.untrusted)
         assert user.is_above(GroupEnum.trusted) is False
 
-    def test_is_above_untrusted_can_access_untrusted(self, db_session):
+    def test_is_above_untrusted_can_access_untrusted(self, user_factory):
         """Untrusted user should be able to access untrusted resources."""
-        user = User(
-            username="untrusted_user",
-            password="hashed_password",
-            group=GroupEnum.untrusted,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.untrusted)
         assert user.is_above(GroupEnum.untrusted) is True
 
-    def test_can_download_admin_true(self, db_session):
+    def test_can_download_admin_true(self, user_factory):
         """Admin user should be able to download."""
-        user = User(
-            username="admin_user",
-            password="hashed_password",
-            group=GroupEnum.admin,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.admin)
         assert user.can_download() is True
 
-    def test_can_download_trusted_true(self, db_session):
+    def test_can_download_trusted_true(self, user_factory):
         """Trusted user should be able to download."""
-        user = User(
-            username="trusted_user",
-            password="hashed_password",
-            group=GroupEnum.trusted,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.trusted)
         assert user.can_download() is True
 
-    def test_can_download_untrusted_false(self, db_session):
+    def test_can_download_untrusted_false(self, user_factory):
         """Untrusted user should NOT be able to download."""
-        user = User(
-            username="untrusted_user",
-            password="hashed_password",
-            group=GroupEnum.untrusted,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.untrusted)
         assert user.can_download() is False
 
-    def test_is_admin_true_for_admin(self, db_session):
+    def test_is_admin_true_for_admin(self, user_factory):
         """is_admin() should return True for admin user."""
-        user = User(
-            username="admin_user",
-            password="hashed_password",
-            group=GroupEnum.admin,
-            root=False,
-        )
-        db_session.add(user)
-        db_session.commit()
-
+        user = user_factory(GroupEnum.admin)
         assert user.is_admin() is True
 
-    def test_is_admin_false_for_non_admin(self, db_session):
+    @pytest.mark.parametrize("group", [GroupEnum.trusted, GroupEnum.untrusted])
+    def test_is_admin_false_for_non_admin(self, user_factory, group):
         """is_admin() should return False for non-admin users."""
-        for group in [GroupEnum.trusted, GroupEnum.untrusted]:
-            user = User(
-                username=f"user_{group}",
-                password="hashed_password",
-                group=group,
-                root=False,
-            )
-            db_session.add(user)
-            db_session.commit()
+        user = user_factory(group)
+        assert user.is_admin() is False
 
-            assert user.is_admin() is False
-
-    def test_is_self_true(self, db_session):
+    def test_is_self_true(self, user_factory):
         """is_self() should return True when username matches."""
-        user = User(
-            username="alice",
-            password="hashed_password",
-            group=GroupEnum.admin,
-            root=False,
-        )
+        user = user_factory(GroupEnum.admin, username="alice")
         assert user.is_self("alice") is True
 
-    def test_is_self_false(self, db_session):
+    def test_is_self_false(self, user_factory):
         """is_self() should return False when username doesn't match."""
-        user = User(
-            username="alice",
-            password="hashed_password",
-            group=GroupEnum.admin,
-            root=False,
-        )
+        user = user_factory(GroupEnum.admin, username="alice")
         assert user.is_self("bob") is False
 
 
 class TestAuthenticateUser:
     """Test user authentication function."""
 
-    def test_authenticate_user_success(self, db_session):
+    def test_authenticate_user_success(self, db_session, make_alice):
         """authenticate_user should return user for correct credentials."""
-        user = create_user("alice", "password123")
-        db_session.add(user)
-        db_session.commit()
+        make_alice()
 
         result = authenticate_user(db_session, "alice", "password123")
         assert result is not None
         assert result.username == "alice"
 
-    def test_authenticate_user_wrong_password(self, db_session):
+    def test_authenticate_user_wrong_password(self, db_session, make_alice):
         """authenticate_user should return None for incorrect password."""
-        user = create_user("alice", "password123")
-        db_session.add(user)
-        db_session.commit()
+        make_alice()
 
         result = authenticate_user(db_session, "alice", "wrongpassword")
         assert result is None
@@ -325,11 +302,9 @@ class TestAuthenticateUser:
         result = authenticate_user(db_session, "nonexistent", "password123")
         assert result is None
 
-    def test_authenticate_user_empty_password(self, db_session):
+    def test_authenticate_user_empty_password(self, db_session, make_alice):
         """authenticate_user should return None for empty password."""
-        user = create_user("alice", "password123")
-        db_session.add(user)
-        db_session.commit()
+        make_alice()
 
         result = authenticate_user(db_session, "alice", "")
         assert result is None
@@ -338,36 +313,23 @@ class TestAuthenticateUser:
 class TestCreateUser:
     """Test user creation function."""
 
-    def test_create_user_default_group(self):
-        """create_user should default to untrusted group."""
-        user = create_user("alice", "password123")
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            ({}, {"group": GroupEnum.untrusted, "root": False, "extra_data": None}),
+            ({"group": GroupEnum.trusted}, {"group": GroupEnum.trusted}),
+            ({"group": GroupEnum.admin}, {"group": GroupEnum.admin}),
+            ({"root": True}, {"root": True}),
+            ({"extra_data": "custom_data"}, {"extra_data": "custom_data"}),
+        ],
+        ids=["default", "trusted", "admin", "root", "extra_data"],
+    )
+    def test_create_user_fields(self, kwargs, expected):
+        """create_user should apply defaults and accept overrides."""
+        user = create_user("alice", "password123", **kwargs)
         assert user.username == "alice"
-        assert user.group == GroupEnum.untrusted
-        assert user.root is False
-
-    def test_create_user_trusted_group(self):
-        """create_user should accept trusted group."""
-        user = create_user("alice", "password123", group=GroupEnum.trusted)
-        assert user.group == GroupEnum.trusted
-
-    def test_create_user_admin_group(self):
-        """create_user should accept admin group."""
-        user = create_user("alice", "password123", group=GroupEnum.admin)
-        assert user.group == GroupEnum.admin
-
-    def test_create_user_root_flag(self):
-        """create_user should accept root flag."""
-        user = create_user("alice", "password123", root=True)
-        assert user.root is True
-
-    def test_create_user_extra_data(self):
-        """create_user should accept extra_data."""
-        user = create_user("alice", "password123", extra_data="custom_data")
-        assert user.extra_data == "custom_data"
-
-    def test_create_user_password_hashed(self):
-        """create_user should hash password."""
-        user = create_user("alice", "password123")
+        for field, value in expected.items():
+            assert getattr(user, field) == value
         # Password should be hashed, not plain text
         assert user.password != "password123"
 
@@ -375,23 +337,14 @@ class TestCreateUser:
 class TestIsCorrectPassword:
     """Test password verification function."""
 
-    def test_is_correct_password_true(self):
-        """is_correct_password should return True for correct password."""
-        user = create_user("alice", "password123")
-        result = is_correct_password(user, "password123")
-        assert result is True
-
-    def test_is_correct_password_false(self):
-        """is_correct_password should return False for incorrect password."""
-        user = create_user("alice", "password123")
-        result = is_correct_password(user, "wrongpassword")
-        assert result is False
-
-    def test_is_correct_password_empty_string(self):
-        """is_correct_password should return False for empty password."""
-        user = create_user("alice", "password123")
-        result = is_correct_password(user, "")
-        assert result is False
+    @pytest.mark.parametrize(
+        "candidate,expected",
+        [("password123", True), ("wrongpassword", False), ("", False)],
+        ids=["correct", "incorrect", "empty"],
+    )
+    def test_is_correct_password(self, alice_user, candidate, expected):
+        """is_correct_password should only accept the user's own password."""
+        assert is_correct_password(alice_user, candidate) is expected
 
 
 class TestGenerateApiKey:
@@ -401,56 +354,40 @@ class TestGenerateApiKey:
         """generate_api_key should return a URL-safe string."""
         key = generate_api_key()
         assert isinstance(key, str)
-        assert len(key) > 0
         # URL-safe tokens should only contain specific characters
-        import string
-        valid_chars = set(string.ascii_letters + string.digits + "-_")
-        assert all(c in valid_chars for c in key)
+        assert _API_KEY_RE.match(key)
 
     def test_generate_api_key_unique(self):
         """generate_api_key should generate unique keys."""
-        keys = [generate_api_key() for _ in range(100)]
+        # 32 random bytes per key; a handful of keys is enough to catch reuse
+        keys = [generate_api_key() for _ in range(16)]
         assert len(keys) == len(set(keys))
+        assert all(len(key) >= 32 and _API_KEY_RE.match(key) for key in keys)
 
 
 class TestCreateApiKey:
     """Test API key creation function."""
 
-    def test_create_api_key_returns_tuple(self, db_session):
+    def test_create_api_key_returns_tuple(self, alice_with_key):
         """create_api_key should return tuple of (APIKey, private_key)."""
-        user = create_user("alice", "password123")
-        db_session.add(user)
-        db_session.commit()
-
-        api_key_obj, private_key = create_api_key(user, "test_key")
+        _, api_key_obj, private_key = alice_with_key
         assert isinstance(api_key_obj, APIKey)
         assert isinstance(private_key, str)
 
-    def test_create_api_key_has_user_username(self, db_session):
+    def test_create_api_key_has_user_username(self, alice_with_key):
         """create_api_key should link API key to user."""
-        user = create_user("alice", "password123")
-        db_session.add(user)
-        db_session.commit()
-
-        api_key_obj, _ = create_api_key(user, "test_key")
+        _, api_key_obj, _ = alice_with_key
         assert api_key_obj.user_username == "alice"
 
-    def test_create_api_key_has_name(self, db_session):
+    @pytest.mark.parametrize("api_key_name", ["my_api_key"])
+    def test_create_api_key_has_name(self, alice_with_key):
         """create_api_key should store API key name."""
-        user = create_user("alice", "password123")
-        db_session.add(user)
-        db_session.commit()
-
-        api_key_obj, _ = create_api_key(user, "my_api_key")
+        _, api_key_obj, _ = alice_with_key
         assert api_key_obj.name == "my_api_key"
 
-    def test_create_api_key_hashes_private_key(self, db_session):
+    def test_create_api_key_hashes_private_key(self, alice_with_key):
         """create_api_key should hash the private key."""
-        user = create_user("alice", "password123")
-        db_session.add(user)
-        db_session.commit()
-
-        api_key_obj, private_key = create_api_key(user, "test_key")
+        _, api_key_obj, private_key = alice_with_key
         # Hashed key should not match private key
         assert api_key_obj.key_hash != private_key
 
@@ -458,100 +395,62 @@ class TestCreateApiKey:
 class TestDetailedUser:
     """Test DetailedUser model with login_type."""
 
-    def test_detailed_user_can_logout_forms(self):
-        """DetailedUser with forms login should be able to logout."""
-        user = DetailedUser.model_validate({
-            "username": "alice",
-            "password": "hashed",
-            "group": GroupEnum.admin,
-            "root": False,
-            "login_type": LoginTypeEnum.forms,
-        })
-        assert user.can_logout() is True
-
-    def test_detailed_user_can_logout_oidc(self):
-        """DetailedUser with OIDC login should be able to logout."""
-        user = DetailedUser.model_validate({
-            "username": "alice",
-            "password": "hashed",
-            "group": GroupEnum.admin,
-            "root": False,
-            "login_type": LoginTypeEnum.oidc,
-        })
-        assert user.can_logout() is True
-
-    def test_detailed_user_cannot_logout_basic(self):
-        """DetailedUser with basic auth should NOT be able to logout."""
-        user = DetailedUser.model_validate({
-            "username": "alice",
-            "password": "hashed",
-            "group": GroupEnum.admin,
-            "root": False,
-            "login_type": LoginTypeEnum.basic,
-        })
-        assert user.can_logout() is False
-
-    def test_detailed_user_cannot_logout_api_key(self):
-        """DetailedUser with API key should NOT be able to logout."""
-        user = DetailedUser.model_validate({
-            "username": "alice",
-            "password": "hashed",
-            "group": GroupEnum.admin,
-            "root": False,
-            "login_type": LoginTypeEnum.api_key,
-        })
-        assert user.can_logout() is False
-
-    def test_detailed_user_cannot_logout_none(self):
-        """DetailedUser with none auth should NOT be able to logout."""
-        user = DetailedUser.model_validate({
-            "username": "alice",
-            "password": "hashed",
-            "group": GroupEnum.admin,
-            "root": False,
-            "login_type": LoginTypeEnum.none,
-        })
-        assert user.can_logout() is False
+    @pytest.mark.parametrize(
+        "login_type,expected",
+        [
+            (LoginTypeEnum.forms, True),
+            (LoginTypeEnum.oidc, True),
+            (LoginTypeEnum.basic, False),
+            (LoginTypeEnum.api_key, False),
+            (LoginTypeEnum.none, False),
+        ],
+    )
+    def test_detailed_user_can_logout(self, login_type, expected):
+        """Only session-based login types (forms, OIDC) should be able to logout."""
+        # can_logout() only reads login_type, so skip pydantic validation.
+        # Every field is passed explicitly: DetailedUser inherits the mapped
+        # User columns as defaults, which model_construct cannot deepcopy.
+        user = DetailedUser.model_construct(
+            username="alice",
+            password="hashed",
+            group=GroupEnum.admin,
+            root=False,
+            extra_data=None,
+            last_login=None,
+            login_type=login_type,
+        )
+        assert user.can_logout() is expected
 
 
 class TestSessionMiddleware:
     """Test DynamicSessionMiddleware for session management."""
 
-    def test_middleware_initialization(self):
+    def test_middleware_initialization(self, session_middleware_factory):
         """DynamicSessionMiddleware should initialize with correct settings."""
-        app = Mock()
-        linker = DynamicMiddlewareLinker()
-        middleware = DynamicSessionMiddleware(app, "secret_key", linker)
+        app, _, middleware = session_middleware_factory("secret_key")
 
         assert middleware.app is app
         assert middleware.secret_key == "secret_key"
 
-    def test_middleware_update_secret(self):
+    def test_middleware_update_secret(self, session_middleware_factory):
         """DynamicSessionMiddleware should update session secret."""
-        app = Mock()
-        linker = DynamicMiddlewareLinker()
-        middleware = DynamicSessionMiddleware(app, "old_secret", linker)
+        _, _, middleware = session_middleware_factory("old_secret")
 
         middleware.update_secret("new_secret")
         assert middleware.secret_key == "old_secret"  # Original stored
         # New session_middleware should be created with new secret
         assert middleware.session_middleware is not None
 
-    def test_middleware_update_max_age(self):
+    def test_middleware_update_max_age(self, session_middleware_factory):
         """DynamicSessionMiddleware should update session max_age."""
-        app = Mock()
-        linker = DynamicMiddlewareLinker()
-        middleware = DynamicSessionMiddleware(app, "secret", linker)
+        _, _, middleware = session_middleware_factory()
 
         middleware.update_max_age(3600)
         assert middleware.session_middleware is not None
 
-    @pytest.mark.asyncio
-    async def test_middleware_call(self):
+    async def test_middleware_call(self, session_middleware_factory):
         """DynamicSessionMiddleware should delegate to wrapped middleware."""
-        app = Mock()
-        linker = DynamicMiddlewareLinker()
-        middleware = DynamicSessionMiddleware(app, "secret", linker)
+        _, _, middleware = session_middleware_factory()
 
         # Mock the session_middleware
         middleware.session_middleware = AsyncMock()
@@ -567,34 +466,26 @@ class TestSessionMiddleware:
 class TestDynamicMiddlewareLinker:
     """Test DynamicMiddlewareLinker for managing multiple middlewares."""
 
-    def test_linker_add_middleware(self):
+    def test_linker_add_middleware(self, session_middleware_factory):
         """DynamicMiddlewareLinker should add middleware to list."""
-        linker = DynamicMiddlewareLinker()
-        app = Mock()
-        middleware = DynamicSessionMiddleware(app, "secret", linker)
+        _, linker, middleware = session_middleware_factory()
 
         assert middleware in linker.middlewares
 
-    def test_linker_update_secret_all_middlewares(self):
+    def test_linker_update_secret_all_middlewares(self, session_middleware_factory):
         """DynamicMiddlewareLinker should update secret for all middlewares."""
-        linker = DynamicMiddlewareLinker()
-        app = Mock()
-
-        middleware1 = DynamicSessionMiddleware(app, "secret1", linker)
-        middleware2 = DynamicSessionMiddleware(app, "secret2", linker)
+        _, linker, middleware1 = session_middleware_factory("secret1")
+        _, _, middleware2 = session_middleware_factory("secret2", linker=linker)
 
         linker.update_secret("new_secret")
         # Both middlewares should have new session_middleware created
         assert middleware1.session_middleware is not None
         assert middleware2.session_middleware is not None
 
-    def test_linker_update_max_age_all_middlewares(self):
+    def test_linker_update_max_age_all_middlewares(self, session_middleware_factory):
         """DynamicMiddlewareLinker should update max_age for all middlewares."""
-        linker = DynamicMiddlewareLinker()
-        app = Mock()
-
-        middleware1 = DynamicSessionMiddleware(app, "secret1", linker)
-        middleware2 = DynamicSessionMiddleware(app, "secret2", linker)
+        _, linker, middleware1 = session_middleware_factory("secret1")
+        _, _, middleware2 = session_middleware_factory("secret2", linker=linker)
 
         linker.update_max_age(7200)
         # Both middlewares should have new session_middleware created
@@ -605,30 +496,17 @@ class TestDynamicMiddlewareLinker:
 class TestOidcConfig:
     """Test OIDC configuration and validation."""
 
-    @pytest.mark.asyncio
-    async def test_set_endpoint_success(self, db_session):
+    async def test_set_endpoint_success(self, db_session, mock_oidc_client):
         """set_endpoint should fetch and store OIDC endpoints."""
-        from contextlib import asynccontextmanager
-        
         config = oidcConfig()
-        
-        response_data = {
-            "authorization_endpoint": "https://auth.example.com/auth",
-            "token_endpoint": "https://auth.example.com/token",
-            "userinfo_endpoint": "https://auth.example.com/userinfo",
-            "end_session_endpoint": "https://auth.example.com/logout",
-        }
-        
-        response = AsyncMock()
-        response.status = 200
-        response.json = AsyncMock(return_value=response_data)
-        
-        @asynccontextmanager
-        async def mock_get(url):
-            yield response
-        
-        client_session = AsyncMock()
-        client_session.get = mock_get
+        client_session = mock_oidc_client(
+            {
+                "authorization_endpoint": "https://auth.example.com/auth",
+                "token_endpoint": "https://auth.example.com/token",
+                "userinfo_endpoint": "https://auth.example.com/userinfo",
+                "end_session_endpoint": "https://auth.example.com/logout",
+            }
+        )
 
         await config.set_endpoint(
             db_session, client_session, "https://auth.example.com/.well-known/openid-configuration"
@@ -637,24 +515,11 @@ class TestOidcConfig:
         assert config.get(db_session, "oidc_authorize_endpoint") == "https://auth.example.com/auth"
         assert config.get(db_session, "oidc_token_endpoint") == "https://auth.example.com/token"
 
-    @pytest.mark.asyncio
-    async def test_set_endpoint_failure(self, db_session):
+    async def test_set_endpoint_failure(self, db_session, mock_oidc_client):
         """set_endpoint should raise InvalidOIDCConfiguration on JSON parse failure."""
-        from contextlib import asynccontextmanager
-        
         config = oidcConfig()
-        
-        response = AsyncMock()
-        response.status = 200
         # Missing required fields will cause validation error
-        response.json = AsyncMock(return_value={})
-        
-        @asynccontextmanager
-        async def mock_get(url):
-            yield response
-        
-        client_session = AsyncMock()
-        client_session.get = mock_get
+        client_session = mock_oidc_client({})
 
         with pytest.raises(InvalidOIDCConfiguration):
             await config.set_endpoint(
@@ -670,91 +535,55 @@ class TestOidcConfig:
 
         assert config.get_redirect_https(db_session) is True
 
-    @pytest.mark.asyncio
-    async def test_validate_success(self, db_session):
+    async def test_validate_success(self, db_session, mock_oidc_client):
         """validate should return None for valid OIDC config."""
-        from contextlib import asynccontextmanager
-        
         config = oidcConfig()
         config.set(db_session, "oidc_endpoint", "https://auth.example.com/.well-known/openid-configuration")
         config.set(db_session, "oidc_scope", "openid profile")
         config.set(db_session, "oidc_username_claim", "sub")
         config.set(db_session, "oidc_group_claim", "groups")
 
-        response = AsyncMock()
-        response.ok = True
-        response.json = AsyncMock(
-            return_value={
+        client_session = mock_oidc_client(
+            {
                 "scopes_supported": ["openid", "profile", "email"],
                 "claims_supported": ["sub", "name", "email", "groups"],
             }
         )
 
-        @asynccontextmanager
-        async def mock_get(url):
-            yield response
-        
-        client_session = AsyncMock()
-        client_session.get = mock_get
-
         result = await config.validate(db_session, client_session)
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_validate_unsupported_scope(self, db_session):
+    async def test_validate_unsupported_scope(self, db_session, mock_oidc_client):
         """validate should return error for unsupported scopes."""
-        from contextlib import asynccontextmanager
-        
         config = oidcConfig()
         config.set(db_session, "oidc_endpoint", "https://auth.example.com/.well-known/openid-configuration")
         config.set(db_session, "oidc_scope", "openid profile custom_scope")
         config.set(db_session, "oidc_username_claim", "sub")
 
-        response = AsyncMock()
-        response.ok = True
-        response.json = AsyncMock(
-            return_value={
+        client_session = mock_oidc_client(
+            {
                 "scopes_supported": ["openid", "profile"],
                 "claims_supported": ["sub", "name", "email"],
             }
         )
 
-        @asynccontextmanager
-        async def mock_get(url):
-            yield response
-        
-        client_session = AsyncMock()
-        client_session.get = mock_get
-
         result = await config.validate(db_session, client_session)
         assert "custom_scope" in result
 
-    @pytest.mark.asyncio
-    async def test_validate_unsupported_username_claim(self, db_session):
+    async def test_validate_unsupported_username_claim(self, db_session, mock_oidc_client):
         """validate should return error for unsupported username claim."""
-        from contextlib import asynccontextmanager
-        
         config = oidcConfig()
         config.set(db_session, "oidc_endpoint", "https://auth.example.com/.well-known/openid-configuration")
         config.set(db_session, "oidc_scope", "openid")
         config.set(db_session, "oidc_username_claim", "custom_username_claim")
 
-        response = AsyncMock()
-        response.ok = True
-        response.json = AsyncMock(
-            return_value={
+        client_session = mock_oidc_client(
+            {
                 "scopes_supported": ["openid"],
                 "claims_supported": ["sub", "name"],
             }
         )
 
-        @asynccontextmanager
-        async def mock_get(url):
-            yield response
-        
-        client_session = AsyncMock()
-        client_session.get = mock_get
-
         result = await config.validate(db_session, client_session)
         assert "Username claim" in result
 
@@ -762,220 +591,140 @@ class TestOidcConfig:
 class TestAPIKeyAuth:
     """Test API key authentication."""
 
-    @pytest.mark.asyncio
-    async def test_api_key_auth_valid_key(self, db_session):
+    async def test_api_key_auth_valid_key(self, db_session, alice_with_key):
         """APIKeyAuth should authenticate valid API key."""
-        # Create user and API key
-        user = create_user("alice", "password", group=GroupEnum.trusted)
-        db_session.add(user)
-        db_session.commit()
-
-        api_key_obj, private_key = create_api_key(user, "test_key")
-        db_session.add(api_key_obj)
-        db_session.commit()
+        _, _, private_key = alice_with_key
 
-        # Test authentication
         auth = APIKeyAuth(lowest_allowed_group=GroupEnum.untrusted)
-        credentials = AsyncMock()
-        credentials.credentials = private_key
-
-        request = MagicMock(spec=Request)
-        bearer_auth = AsyncMock(return_value=credentials)
-        auth.api_key_header = bearer_auth
+        credentials = SimpleNamespace(credentials=private_key)
+        auth.api_key_header = _stub_dependency(credentials)
 
-        result = await auth(request, db_session)
+        result = await auth(_FAKE_REQUEST, db_session)
         assert result.username == "alice"
         assert result.login_type == LoginTypeEnum.api_key
 
-    @pytest.mark.asyncio
     async def test_api_key_auth_invalid_key(self, db_session):
         """APIKeyAuth should reject invalid API key."""
         auth = APIKeyAuth(lowest_allowed_group=GroupEnum.untrusted)
-        credentials = AsyncMock()
-        credentials.credentials = "invalid_key"
-
-        request = MagicMock(spec=Request)
-        bearer_auth = AsyncMock(return_value=credentials)
-        auth.api_key_header = bearer_auth
+        credentials = SimpleNamespace(credentials="invalid_key")
+        auth.api_key_header = _stub_dependency(credentials)
 
         with pytest.raises(HTTPException) as exc_info:
-            await auth(request, db_session)
+            await auth(_FAKE_REQUEST, db_session)
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
 
-    @pytest.mark.asyncio
-    async def test_api_key_auth_insufficient_permissions(self, db_session):
+    async def test_api_key_auth_insufficient_permissions(self, db_session, alice_with_key):
         """APIKeyAuth should reject API key with insufficient permissions."""
-        # Create untrusted user with API key
-        user = create_user("alice", "password", group=GroupEnum.untrusted)
-        db_session.add(user)
-        db_session.commit()
-
-        api_key_obj, private_key = create_api_key(user, "test_key")
-        db_session.add(api_key_obj)
-        db_session.commit()
-
-        # Require trusted group
-        auth = APIKeyAuth(lowest_allowed_group=GroupEnum.trusted)
-        credentials = AsyncMock()
-        credentials.credentials = private_key
+        _, _, private_key = alice_with_key
 
-        request = MagicMock(spec=Request)
-        bearer_auth = AsyncMock(return_value=credentials)
-        auth.api_key_header = bearer_auth
+        # alice is only trusted
+        auth = APIKeyAuth(lowest_allowed_group=GroupEnum.admin)
+        credentials = SimpleNamespace(credentials=private_key)
+        auth.api_key_header = _stub_dependency(credentials)
 
         with pytest.raises(HTTPException) as exc_info:
-            await auth(request, db_session)
+            await auth(_FAKE_REQUEST, db_session)
         assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
 
 
-class TestABRAuth:
-    """Test ABRAuth multi-method authentication dispatcher."""
-
-    @pytest.mark.asyncio
-    async def test_abr_auth_basic_auth(self, db_session):
-        """ABRAuth should authenticate via basic auth."""
-        user = create_user("alice", "password123", group=GroupEnum.admin)
-        db_session.add(user)
-        db_session.commit()
-
-        auth = ABRAuth(lowest_allowed_group=GroupEnum.untrusted)
+def _set_basic_credentials(request, auth):
+    credentials = SimpleNamespace(username="alice", password="password123")
+    auth.security = _stub_dependency(credentials)
 
-        # Mock auth_config to return basic login type
-        with patch("app.internal.auth.authentication.auth_config") as mock_config:
-            mock_config.get_login_type.return_value = LoginTypeEnum.basic
 
-            # Mock HTTPBasic security
-            credentials = AsyncMock()
-            credentials.username = "alice"
-            credentials.password = "password123"
-            auth.security = AsyncMock(return_value=credentials)
+def _set_forms_session(request, auth):
+    request.session = {"sub": "alice"}
 
-            request = MagicMock(spec=Request)
-            result = await auth(request, db_session)
 
-            assert result.username == "alice"
-            assert result.login_type == LoginTypeEnum.basic
+def _set_oidc_session_valid(request, auth):
+    request.session = {"sub": "alice", "exp": time.time() + _FUTURE_EXP_DELTA}
 
-    @pytest.mark.asyncio
-    async def test_abr_auth_session_auth(self, db_session):
-        """ABRAuth should authenticate via session."""
-        user = create_user("alice", "password123", group=GroupEnum.admin)
-        db_session.add(user)
-        db_session.commit()
 
-        auth = ABRAuth(lowest_allowed_group=GroupEnum.untrusted)
+def _leave_request_unset(request, auth):
+    pass
 
-        with patch("app.internal.auth.authentication.auth_config") as mock_config:
-            mock_config.get_login_type.return_value = LoginTypeEnum.forms
 
-            request = MagicMock(spec=Request)
-            request.session = {"sub": "alice"}
+# (login_type, prepare request/auth, result field to check, expected value)
+_ABR_AUTH_SUCCESS_CASES = [
+    (LoginTypeEnum.basic, _set_basic_credentials, "username", "alice"),
+    (LoginTypeEnum.forms, _set_forms_session, "username", "alice"),
+    (LoginTypeEnum.oidc, _set_oidc_session_valid, "username", "alice"),
+    (LoginTypeEnum.none, _leave_request_unset, "group", GroupEnum.admin),
+]
 
-            result = await auth(request, db_session)
-            assert result.username == "alice"
-            assert result.login_type == LoginTypeEnum.forms
 
-    @pytest.mark.asyncio
-    async def test_abr_auth_oidc_auth_valid(self, db_session):
-        """ABRAuth should authenticate OIDC with valid token."""
-        user = create_user("alice", "password123", group=GroupEnum.admin)
-        db_session.add(user)
-        db_session.commit()
+class TestABRAuth:
+    """Test ABRAuth multi-method authentication dispatcher."""
 
+    @pytest.mark.parametrize(
+        "login_type,prepare,field,expected",
+        _ABR_AUTH_SUCCESS_CASES,
+        ids=[case[0].value for case in _ABR_AUTH_SUCCESS_CASES],
+    )
+    async def test_abr_auth_success(
+        self,
+        db_session,
+        seeded_users,
+        mock_auth_config,
+        login_type,
+        prepare,
+        field,
+        expected,
+    ):
+        """ABRAuth should authenticate through each configured login type."""
         auth = ABRAuth(lowest_allowed_group=GroupEnum.untrusted)
+        mock_auth_config.login_type = login_type
 
-        with patch("app.internal.auth.authentication.auth_config") as mock_config:
-            mock_config.get_login_type.return_value = LoginTypeEnum.oidc
-
-            request = MagicMock(spec=Request)
-            request.session = {"sub": "alice", "exp": time.time() + 3600}
+        request = _req()
+        prepare(request, auth)
 
-            result = await auth(request, db_session)
-            assert result.username == "alice"
-            assert result.login_type == LoginTypeEnum.oidc
+        result = await auth(request, db_session)
+        assert getattr(result, field) == expected
+        assert result.login_type == login_type
 
-    @pytest.mark.asyncio
-    async def test_abr_auth_oidc_auth_expired(self, db_session):
+    async def test_abr_auth_oidc_auth_expired(self, db_session, mock_auth_config):
         """ABRAuth should reject expired OIDC token."""
         auth = ABRAuth(lowest_allowed_group=GroupEnum.untrusted)
 
-        with patch("app.internal.auth.authentication.auth_config") as mock_config:
-            mock_config.get_login_type.return_value = LoginTypeEnum.oidc
-
-            request = MagicMock(spec=Request)
-            request.session = {"sub": "alice", "exp": time.time() - 3600}  # Expired
-
-            with pytest.raises(RequiresLoginException):
-                await auth(request, db_session)
-
-    @pytest.mark.asyncio
-    async def test_abr_auth_none_login(self, db_session):
-        """ABRAuth should return admin user for none auth."""
-        user = create_user("admin_user", "password", group=GroupEnum.admin)
-        db_session.add(user)
-        db_session.commit()
-
-        auth = ABRAuth(lowest_allowed_group=GroupEnum.untrusted)
-
-        with patch("app.internal.auth.authentication.auth_config") as mock_config:
-            mock_config.get_login_type.return_value = LoginTypeEnum.none
+        mock_auth_config.login_type = LoginTypeEnum.oidc
 
-            request = MagicMock(spec=Request)
+        request = _req({"sub": "alice", "exp": time.time() - _FUTURE_EXP_DELTA})  # Expired
 
-            result = await auth(request, db_session)
-            assert result.group == GroupEnum.admin
+        with pytest.raises(RequiresLoginException):
+            await auth(request, db_session)
 
-    @pytest.mark.asyncio
-    async def test_abr_auth_insufficient_permissions(self, db_session):
+    async def test_abr_auth_insufficient_permissions(self, db_session, seeded_users, mock_auth_config):
         """ABRAuth should reject user with insufficient permissions."""
-        user = create_user("alice", "password123", group=GroupEnum.untrusted)
-        db_session.add(user)
-        db_session.commit()
-
         auth = ABRAuth(lowest_allowed_group=GroupEnum.admin)
 
-        with patch("app.internal.auth.authentication.auth_config") as mock_config:
-            mock_config.get_login_type.return_value = LoginTypeEnum.basic
+        mock_auth_config.login_type = LoginTypeEnum.basic
 
-            credentials = AsyncMock()
-            credentials.username = "alice"
-            credentials.password = "password123"
-            auth.security = AsyncMock(return_value=credentials)
+        credentials = SimpleNamespace(username="alice_untrusted", password="password123")
+        auth.security = _stub_dependency(credentials)
 
-            request = MagicMock(spec=Request)
-
-            with pytest.raises(HTTPException) as exc_info:
-                await auth(request, db_session)
-            assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+        with pytest.raises(HTTPException) as exc_info:
+            await auth(_FAKE_REQUEST, db_session)
+        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
 
-    @pytest.mark.asyncio
-    async def test_abr_auth_session_not_found(self, db_session):
+    async def test_abr_auth_session_not_found(self, db_session, mock_auth_config):
         """ABRAuth should raise RequiresLoginException when user not in session."""
         auth = ABRAuth(lowest_allowed_group=GroupEnum.untrusted)
 
-        with patch("app.internal.auth.authentication.auth_config") as mock_config:
-            mock_config.get_login_type.return_value = LoginTypeEnum.forms
-
-            request = MagicMock(spec=Request)
-            request.session = {}  # No 'sub' in session
+        mock_auth_config.login_type = LoginTypeEnum.forms
 
-            with pytest.raises(RequiresLoginException):
-                await auth(request, db_session)
+        request = _req()  # No 'sub' in session
 
-
-# Import time for OIDC expiry tests
-import time
+        with pytest.raises(RequiresLoginException):
+            await auth(request, db_session)
 
 
 class TestAuthIntegrityErrors:
     """Test IntegrityError handling in authentication operations."""
 
-    def test_authenticate_user_password_rehash_integrity_error(self, db_session):
+    def test_authenticate_user_password_rehash_integrity_error(self, db_session, make_alice):
         """authenticate_user handles IntegrityError during password rehash."""
         # Create user with old password hash
-        user = create_user("alice", "password123")
-        db_session.add(user)
-        db_session.commit()
+        make_alice()
         
         # Simulate IntegrityError during rehash by mocking session.commit
         original_commit = db_session.commit
@@ -999,11 +748,9 @@ class TestAuthIntegrityErrors:
         result = authenticate_user(db_session, "nonexistent", "password123")
         assert result is None
 
-    def test_authenticate_user_session_integrity_handling(self, db_session):
+    def test_authenticate_user_session_integrity_handling(self, db_session, make_alice):
         """authenticate_user properly handles session errors."""
-        user = create_user("alice", "password123")
-        db_session.add(user)
-        db_session.commit()
+        make_alice()
         
         # Verify that the user is retrievable after authentication
         result = authenticate_user(db_session, "alice", "password123")
@@ -1038,17 +785,15 @@ class TestOIDCConcurrency:
 
     def test_oidc_login_handles_concurrent_creation_integrity_error(self, db_session):
         """OIDC login handles concurrent user creation via IntegrityError."""
-        from datetime import datetime as dt
-        
         # Create a user to simulate race condition
         initial_user = User(username="concurrent_user", password="initial_hash", 
                            group=GroupEnum.untrusted)
         db_session.add(initial_user)
-        db_session.commit()
+        db_session.flush()
         
         # Now simulate what happens during OIDC - get user again, same session
         user2 = db_session.exec(select(User).where(User.username == "concurrent_user")).first()
-        user2.last_login = dt.now()
+        user2.last_login = datetime.now()
         
         # This should not raise because user already exists
         db_session.add(user2)
@@ -2,7 +2,7 @@
 import threading
 import time
 import pytest
-from app.util.cache import ModificationTracker, SimpleCache, CacheMetrics
+from app.util.cache import ModificationTracker, SimpleCache, CacheMetrics, TTLCache
 
 
 class TestModificationTracker:
@@ -198,6 +198,80 @@ class TestSimpleCacheLRU:
         assert isinstance(metrics.evictions, int)
 
 
+class TestSimpleCacheExpire:
+    """Expiry sweep tests for SimpleCache."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Mutable fake time.time(), advanced by the tests."""
+        now = [1000.0]
+        monkeypatch.setattr("app.util.cache.time.time", lambda: now[0])
+        return now
+
+    def test_expire_drops_only_expired(self, clock):
+        """expire() should drop entries older than the TTL and keep the rest."""
+        cache = SimpleCache()
+        cache.set(["old"], "q1")
+        clock[0] += 50
+        cache.set(["new"], "q2")
+        clock[0] += 60
+
+        cache.expire(100)
+
+        assert cache.size() == 1
+        assert cache.get(100, "q2") == ["new"]
+
+    def test_expire_keeps_overwritten_entry(self, clock):
+        """An entry re-set after its first insert should expire by its latest timestamp."""
+        cache = SimpleCache()
+        cache.set(["v1"], "q1")
+        clock[0] += 80
+        cache.set(["v2"], "q1")
+        clock[0] += 30
+
+        cache.expire(100)
+
+        assert cache.get(100, "q1") == ["v2"]
+
+    def test_expire_ignores_lru_order(self, clock):
+        """Reading an old entry must not protect it from expiry."""
+        cache = SimpleCache()
+        cache.set(["old"], "q1")
+        clock[0] += 50
+        cache.set(["new"], "q2")
+        cache.get(1000, "q1")
+        clock[0] += 60
+
+        cache.expire(100)
+
+        assert cache.get(1000, "q1") is None
+        assert cache.get(1000, "q2") == ["new"]
+
+    def test_expiry_queue_bounded_without_expire(self, clock):
+        """Re-setting the same key should not grow the expiry queue when expire() is never called."""
+        cache = SimpleCache()
+        for i in range(10_000):
+            cache.set([i], "q1")
+
+        assert cache.size() == 1
+        assert len(cache._expiry) <= 2 * cache.size() + 16
+
+    def test_expire_after_compaction(self, clock):
+        """Entries should still expire in age order after the expiry queue was compacted."""
+        cache = SimpleCache(maxsize=2)
+        cache.set(["old"], "q1")
+        clock[0] += 50
+        for i in range(100):
+            cache.set([i], "q2")
+        cache.get(1000, "q1")  # q1 is the most recently used, but still the oldest
+        clock[0] += 60
+
+        cache.expire(100)
+
+        assert cache.get(1000, "q1") is None
+        assert cache.get(1000, "q2") == [99]
+
+
 class TestCacheMetrics:
     """CacheMetrics class tests."""
 
@@ -301,3 +375,83 @@ class TestCachePerformance:
         assert elapsed < 10.0
         assert len(results) == 1000
         assert cache.size() <= 100
+
+
+class TestTTLCache:
+    """TTLCache expiry and size bound tests."""
+
+    @pytest.fixture
+    def clock(self):
+        """Mutable fake time, advanced by the tests."""
+        return [1000.0]
+
+    def test_get_before_expiry(self, clock):
+        """Entries should be readable until their TTL has passed."""
+        cache = TTLCache(maxsize=10, ttl=60, timer=lambda: clock[0])
+        cache["a"] = 1
+        clock[0] += 59
+        assert cache["a"] == 1
+        assert cache.get("a") == 1
+
+    def test_get_after_expiry_misses(self, clock):
+        """Expired entries should behave as missing."""
+        cache = TTLCache(maxsize=10, ttl=60, timer=lambda: clock[0])
+        cache["a"] = 1
+        clock[0] += 60
+        assert cache.get("a") is None
+        assert "a" not in cache
+
+    def test_set_refreshes_expiry(self, clock):
+        """Re-setting a key should restart its TTL."""
+        cache = TTLCache(maxsize=10, ttl=60, timer=lambda: clock[0])
+        cache["a"] = 1
+        cache["b"] = 2
+        clock[0] += 30
+        cache["a"] = 3
+        clock[0] += 40
+        cache.expire()
+        assert list(cache) == ["a"]
+        assert cache["a"] == 3
+
+    def test_evicts_oldest_over_maxsize(self, clock):
+        """The oldest entry should be evicted once maxsize is exceeded."""
+        cache = TTLCache(maxsize=2, ttl=60, timer=lambda: clock[0])
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["c"] = 3
+        assert list(cache) == ["b", "c"]
+
+    def test_reads_do_not_reorder(self, clock):
+        """Reads shouldn't move entries, insertion order has to stay expiry order."""
+        cache = TTLCache(maxsize=2, ttl=60, timer=lambda: clock[0])
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1
+        cache["c"] = 3
+        assert list(cache) == ["b", "c"]
+
+    def test_expire_drops_only_expired(self, clock):
+        """expire() should drop expired entries and keep fresh ones."""
+        cache = TTLCache(maxsize=10, ttl=60, timer=lambda: clock[0])
+        cache["old"] = 1
+        clock[0] += 30
+        cache["new"] = 2
+        clock[0] += 31
+        cache.expire()
+        assert len(cache) == 1
+        assert "new" in cache
+
+    def test_set_drains_expired(self, clock):
+        """Inserting should drop expired entries even if they are never read again."""
+        cache = TTLCache(maxsize=10, ttl=60, timer=lambda: clock[0])
+        cache["old"] = 1
+        clock[0] += 61
+        cache["new"] = 2
+        assert list(cache._data) == ["new"]
+
+    def test_clear(self, clock):
+        """clear() should drop every entry."""
+        cache = TTLCache(maxsize=10, ttl=60, timer=lambda: clock[0])
+        cache["a"] = 1
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,55 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.util import connection
+from app.util.connection import close_shared_client_session, get_shared_client_session
+
+
+@pytest.mark.asyncio
+class TestSharedClientSession:
+    """Shared aiohttp session tests."""
+
+    async def test_session_reused_until_closed(self):
+        """The same session should be returned until it is closed."""
+        session = get_shared_client_session()
+        try:
+            assert get_shared_client_session() is session
+        finally:
+            await close_shared_client_session()
+
+        assert session.closed
+        new_session = get_shared_client_session()
+        try:
+            assert new_session is not session
+        finally:
+            await close_shared_client_session()
+
+    async def test_session_of_previous_loop_closed(self):
+        """A session replaced because the event loop changed should be closed."""
+        session = get_shared_client_session()
+        previous_loop = asyncio.new_event_loop()
+        connection._shared_session_loop = previous_loop
+        try:
+            new_session = get_shared_client_session()
+            assert new_session is not session
+            await asyncio.gather(*connection._closing_sessions)
+            assert session.closed
+            assert not connection._closing_sessions
+        finally:
+            previous_loop.close()
+            await close_shared_client_session()
+
+    async def test_connector_limits_follow_settings(self):
+        """Connections per host should cover the configured concurrent Audible requests."""
+        await close_shared_client_session()
+        with patch("app.util.connection.Settings") as mock_settings:
+            mock_settings.return_value.app.max_concurrent_audible_requests = 30
+            session = get_shared_client_session()
+        try:
+            assert session.connector is not None
+            assert session.connector.limit_per_host == 30
+            assert session.connector.limit >= 2 * 30
+        finally:
+            await close_shared_client_session()